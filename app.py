@@ -1,5 +1,7 @@
 # ceoparkmake/app.py
 
+import uuid
+
 import streamlit as st
 
 from ui.styles import apply_global_styles
@@ -9,31 +11,15 @@ from ui.components import (
     render_character_panel,
     render_event_panel,
     render_logs,
+    fragment,
 )
 
-from game.state import (
-    init_game_state,
-    push_log,
-    clamp_stats,
-)
-from game.logic import (
-    do_work,
-    do_rest,
-    do_part_time,
-    maybe_trigger_dialogue_event,
-    maybe_trigger_adventure_event,
-    resolve_pending_event_choice,
-    try_promotion,
-    check_for_forced_retirement,
-    retire_and_rehire,
-    check_endings,
-)
-from game.content_loader import (
-    load_dialogue_events,
-    load_adventure_events,
-    load_upgrades,
-    load_endings,
-)
+from game.state import init_game_state
+from game import engine
+from game.content import get_content, start_content_watcher
+from game.ranks import pin_rank_table
+from game.serialize import SnapshotError, dumps_state, loads_state
+from game.session_store import open_session_store
 
 
 # =========================================================
@@ -41,190 +27,126 @@ from game.content_loader import (
 # =========================================================
 apply_global_styles()
 
-# JSON 데이터(캐시)
-@st.cache_data
-def _load_all_content():
-    return {
-        "dialogue_events": load_dialogue_events(),
-        "adventure_events": load_adventure_events(),
-        "upgrades": load_upgrades(),
-        "endings": load_endings(),
-    }
-
-content = _load_all_content()
+# JSON 데이터: 프로세스 전역 스냅샷
+# - 감시 스레드가 data/*.json 변경 시 백그라운드에서 교체 (재시작 없이 콘텐츠 반영)
+# - 한 번의 rerun 동안은 같은 스냅샷만 사용 (직급 테이블도 이 스냅샷 것으로 고정)
+start_content_watcher()
+content = get_content()
+pin_rank_table(content.rank_table)
 
 
 # =========================================================
 # 1) 세션 상태 초기화
 # =========================================================
-def ensure_session():
-    if "game" not in st.session_state:
-        st.session_state.game = init_game_state()
-
-    # 구매한 업그레이드 id 저장
-    if "purchased_upgrades" not in st.session_state:
-        st.session_state.purchased_upgrades = set()
+# 세션 저장소: URL의 sid로 진행 상황 복원 (재접속 / 워커 재시작 대비)
+store = open_session_store()
 
-    # 발동된 엔딩(중복 팝업 방지)
-    if "triggered_ending_id" not in st.session_state:
-        st.session_state.triggered_ending_id = None
 
+def _session_id() -> str:
+    sid = st.query_params.get("sid")
+    if not sid:
+        sid = uuid.uuid4().hex
+        st.query_params["sid"] = sid
+    return sid
 
-ensure_session()
-g = st.session_state.game
 
+def _load_saved_game(sid: str):
+    data = store.get(sid)
+    if data is None:
+        return None
+    try:
+        return loads_state(data, content)
+    except SnapshotError:
+        return None
 
-# =========================================================
-# 2) 업그레이드 적용 함수
-# =========================================================
-def _apply_upgrade_effects(game, effects: dict):
-    """
-    upgrades.json 효과 적용
-    - 즉시효과: hp, mental, hp_max, mental_max, promotion_rate
-    - 영구보너스: work_money_bonus, work_exp_bonus (세션 상태에 누적 저장)
-    """
-    if not effects:
-        return
-
-    # 즉시/스탯 효과
-    if "hp_max" in effects:
-        game.hp_max += int(effects["hp_max"])
-    if "mental_max" in effects:
-        game.mental_max += int(effects["mental_max"])
-    if "hp" in effects:
-        game.hp += int(effects["hp"])
-    if "mental" in effects:
-        game.mental += int(effects["mental"])
-    if "promotion_rate" in effects:
-        game.promotion_rate += int(effects["promotion_rate"])
 
-    # 영구 업무 보너스는 세션에 누적
-    if "upgrade_bonuses" not in st.session_state:
-        st.session_state.upgrade_bonuses = {"work_money_bonus": 0, "work_exp_bonus": 0}
+def ensure_session():
+    # 구매한 업그레이드 / 업무 보너스 / 발동된 엔딩은 GameState 안에 있음
+    if "sid" not in st.session_state:
+        st.session_state.sid = _session_id()
+    if "game" not in st.session_state:
+        st.session_state.game = _load_saved_game(st.session_state.sid) or init_game_state()
 
-    if "work_money_bonus" in effects:
-        st.session_state.upgrade_bonuses["work_money_bonus"] += int(effects["work_money_bonus"])
-    if "work_exp_bonus" in effects:
-        st.session_state.upgrade_bonuses["work_exp_bonus"] += int(effects["work_exp_bonus"])
 
-    clamp_stats(game)
+def save_session():
+    """
+    저장은 write-behind (대기열에 넣고 바로 반환)
+    - 스냅샷은 고정 크기로 덮어쓰기
+    - 행동 저널은 지난 저장 이후 새로 쌓인 부분만 append 하고 메모리에서는 비운다
+      (전체 저널은 store.get_journal(sid))
+    """
+    sid = st.session_state.sid
+    g = st.session_state.game
+    if g.journal:
+        store.append_journal(sid, bytes(g.journal))
+        g.journal.clear()
+    store.put(sid, dumps_state(g))
 
 
-def _get_upgrade_bonuses():
-    if "upgrade_bonuses" not in st.session_state:
-        st.session_state.upgrade_bonuses = {"work_money_bonus": 0, "work_exp_bonus": 0}
-    return st.session_state.upgrade_bonuses
+ensure_session()
+g = st.session_state.game
 
 
 # =========================================================
-# 3) 게임 액션 래퍼 (공통 후처리 포함)
+# 2) 게임 액션 래퍼 (공통 후처리 포함)
 # =========================================================
-def _post_action_checks():
-    """액션 후 공통 판정: 강제퇴사 -> 엔딩"""
-    global g
-
-    # 체력/멘탈 바닥 퇴사
-    forced_reason = check_for_forced_retirement(g)
-    if forced_reason:
-        st.session_state.game = retire_and_rehire(g, forced_reason)
-        g = st.session_state.game
-
-    # 엔딩 판정 (최초 1회만)
-    if st.session_state.triggered_ending_id is None:
-        ending = check_endings(g, content["endings"])
-        if ending:
-            st.session_state.triggered_ending_id = ending.get("id")
-            st.session_state.triggered_ending = ending
-
-
-def action_work():
-    """업무 + 업그레이드 보너스 반영 + 이벤트 확률 발생"""
-    global g
-
-    # 기본 업무 수행
-    do_work(g)
-
-    # 업그레이드 보너스 추가 반영
-    bonuses = _get_upgrade_bonuses()
-    bonus_money = int(bonuses.get("work_money_bonus", 0))
-    bonus_exp = int(bonuses.get("work_exp_bonus", 0))
-
-    if bonus_money > 0:
-        g.money += bonus_money
-        push_log(g, f"⚙️ 업무능력 보너스: 돈 +{bonus_money}")
-
-    if bonus_exp > 0:
-        g.exp += bonus_exp
-        push_log(g, f"⚙️ 업무능력 보너스: 경력 +{bonus_exp}")
-
-    clamp_stats(g)
-
-    # 업무 후 이벤트 판정 (대화 우선, 모험 후순위)
-    if not maybe_trigger_dialogue_event(g, content["dialogue_events"], chance=0.35):
-        maybe_trigger_adventure_event(g, content["adventure_events"], chance=0.20)
-
-    _post_action_checks()
-
-
-def action_rest():
-    do_rest(g)
-
-    # 휴식 후 가끔 대화 이벤트
-    maybe_trigger_dialogue_event(g, content["dialogue_events"], chance=0.18)
-    _post_action_checks()
-
-
-def action_part_time():
-    global g
-    reason = do_part_time(g)
-    if reason:
-        st.session_state.game = retire_and_rehire(g, reason)
-        g = st.session_state.game
-    else:
-        maybe_trigger_dialogue_event(g, content["dialogue_events"], chance=0.15)
-
-    _post_action_checks()
-
-
-def action_try_promotion():
+def run_action(action):
+    """
+    행동 1회: 전체 턴 처리는 game.engine.step (강제퇴사 / 엔딩 판정 포함)
+    퇴사하면 새 GameState가 오므로 세션에 다시 넣고 저장
+    """
     global g
-    success, retire_reason = try_promotion(g)
+    g, _ = engine.step(g, action, content)
+    st.session_state.game = g
+    save_session()
 
-    if retire_reason:
-        st.session_state.game = retire_and_rehire(g, retire_reason)
-        g = st.session_state.game
-    else:
-        # 승진 성공 시 승진 이벤트 감성 로그/대화 가끔
-        if success:
-            push_log(g, "✨ 회사 공기가 조금 달라진 것 같다.")
-        maybe_trigger_dialogue_event(g, content["dialogue_events"], chance=0.25)
 
-    _post_action_checks()
+_AUTO_STOP_TEXT = {
+    engine.STOP_DONE: "지정한 턴을 모두 진행했다",
+    engine.STOP_EVENT: "이벤트 발생",
+    engine.STOP_PROMOTION: "승진 시도 가능",
+    engine.STOP_RETIRED: "퇴사 발생",
+    engine.STOP_ENDING: "엔딩 달성",
+}
 
 
-def action_choice(choice_idx: int):
+def run_auto_play(turns: int):
+    """업무/휴식 N턴을 서버에서 한 번에 진행하고 마지막에 한 번만 그린다"""
     global g
-    retire_reason = resolve_pending_event_choice(g, choice_idx)
-    if retire_reason:
-        st.session_state.game = retire_and_rehire(g, retire_reason)
-        g = st.session_state.game
-
-    _post_action_checks()
+    g, result = engine.auto_play(g, turns, content)
+    st.session_state.game = g
+    st.session_state.auto_play_note = f"⏩ 자동 진행 {result.turns}턴 · {_AUTO_STOP_TEXT[result.stop_reason]}"
+    save_session()
+
+
+@fragment
+def render_auto_play_controls():
+    """턴 수 입력을 바꿔도 이 부분만 rerun (진행 버튼은 전체 rerun)"""
+    b1, b2 = st.columns([1, 1], vertical_alignment="bottom")
+    with b1:
+        auto_turns = st.number_input(
+            "자동 진행 턴 수",
+            min_value=1,
+            max_value=engine.AUTO_PLAY_MAX_TURNS,
+            value=10,
+            step=1,
+        )
+    with b2:
+        if st.button("⏩ 자동 업무", use_container_width=True, disabled=g.pending_event is not None):
+            run_auto_play(int(auto_turns))
+            st.rerun()
 
 
 # =========================================================
-# 4) 사이드바: 게임 제어 / 디버그성 편의
+# 3) 사이드바: 게임 제어 / 디버그성 편의
 # =========================================================
 with st.sidebar:
     st.markdown("### 🎮 게임 제어")
 
     if st.button("🔄 새 게임 시작", use_container_width=True):
+        store.delete(st.session_state.sid)  # 이전 게임 저널도 같이 삭제
         st.session_state.game = init_game_state()
-        st.session_state.purchased_upgrades = set()
-        st.session_state.upgrade_bonuses = {"work_money_bonus": 0, "work_exp_bonus": 0}
-        st.session_state.triggered_ending_id = None
-        if "triggered_ending" in st.session_state:
-            del st.session_state["triggered_ending"]
+        save_session()
         st.rerun()
 
     st.markdown("---")
@@ -233,7 +155,7 @@ with st.sidebar:
 
 
 # =========================================================
-# 5) 메인 레이아웃
+# 4) 메인 레이아웃
 # =========================================================
 render_header(g)
 
@@ -258,8 +180,9 @@ with left:
         st.markdown("</div>", unsafe_allow_html=True)
 
     # 엔딩 팝업 느낌 패널
-    if st.session_state.get("triggered_ending_id") and st.session_state.get("triggered_ending"):
-        e = st.session_state["triggered_ending"]
+    triggered_ending = content.endings.get(g.triggered_ending_id) if g.triggered_ending_id else None
+    if triggered_ending:
+        e = triggered_ending
         st.markdown('<div class="pixel-card">', unsafe_allow_html=True)
         st.markdown(
             f"""
@@ -282,7 +205,7 @@ with left:
         for i, ch in enumerate(choices):
             label = ch.get("label", f"선택지 {i+1}")
             if st.button(label, key=f"event_choice_{g.pending_event.get('id','evt')}_{i}", use_container_width=True):
-                action_choice(i)
+                run_action(engine.choice(i))
                 st.rerun()
 
         st.markdown("</div>", unsafe_allow_html=True)
@@ -294,22 +217,29 @@ with left:
     a1, a2, a3, a4 = st.columns(4)
     with a1:
         if st.button("💼 업무", use_container_width=True, disabled=g.pending_event is not None):
-            action_work()
+            run_action(engine.WORK)
             st.rerun()
     with a2:
         if st.button("☕ 휴식", use_container_width=True, disabled=g.pending_event is not None):
-            action_rest()
+            run_action(engine.REST)
             st.rerun()
     with a3:
         if st.button("🎬 알바", use_container_width=True, disabled=g.pending_event is not None):
-            action_part_time()
+            run_action(engine.PART_TIME)
             st.rerun()
     with a4:
         promo_disabled = (g.pending_event is not None) or (g.rank == "CEO")
         if st.button("📈 승진", use_container_width=True, disabled=promo_disabled):
-            action_try_promotion()
+            run_action(engine.PROMOTE)
             st.rerun()
 
+    # 자동 진행: 체력/멘탈 낮으면 휴식, 아니면 업무 (이벤트/승진 가능/퇴사/엔딩에서 멈춤)
+    render_auto_play_controls()
+
+    auto_note = st.session_state.pop("auto_play_note", None)
+    if auto_note:
+        st.caption(auto_note)
+
     # 승진 보조 안내
     if g.rank != "CEO":
         if g.can_try_promotion:
@@ -334,62 +264,34 @@ with right:
     st.markdown('<div class="pixel-card">', unsafe_allow_html=True)
     st.markdown('<div class="section-title">🧠 스펙업</div>', unsafe_allow_html=True)
 
-    upgrade_cats = content["upgrades"] or {}
-    purchased = st.session_state.purchased_upgrades
+    catalog = content.upgrade_catalog
+    purchased = g.purchased_upgrades
 
-    if not upgrade_cats:
+    if not len(catalog):
         st.info("upgrades.json 비어있음")
     else:
-        tabs = st.tabs(list(upgrade_cats.keys()))
-        for tab, cat_name in zip(tabs, upgrade_cats.keys()):
+        tabs = st.tabs(list(catalog.categories.keys()))
+        for tab, rows in zip(tabs, catalog.categories.values()):
             with tab:
-                items = upgrade_cats.get(cat_name, [])
-                if not items:
+                if not rows:
                     st.caption("항목 없음")
                     continue
 
-                for item in items:
-                    uid = item.get("id", "")
-                    name = item.get("name", "업그레이드")
-                    cost = int(item.get("cost", 0))
-                    effects = item.get("effects", {})
-
+                for row in rows:
                     col_a, col_b = st.columns([2.8, 1.2], vertical_alignment="center")
 
                     with col_a:
-                        effect_texts = []
-                        for k, v in effects.items():
-                            if k == "work_money_bonus":
-                                effect_texts.append(f"업무 돈 +{v}")
-                            elif k == "work_exp_bonus":
-                                effect_texts.append(f"업무 경력 +{v}")
-                            elif k == "promotion_rate":
-                                effect_texts.append(f"승진확률 +{v}%")
-                            elif k == "hp_max":
-                                effect_texts.append(f"최대체력 +{v}")
-                            elif k == "mental_max":
-                                effect_texts.append(f"최대멘탈 +{v}")
-                            elif k == "hp":
-                                effect_texts.append(f"체력 +{v}")
-                            elif k == "mental":
-                                effect_texts.append(f"멘탈 +{v}")
-                            else:
-                                effect_texts.append(f"{k}:{v}")
-
-                        st.markdown(f"**{name}**")
-                        st.caption(f"비용 {cost}원 · " + ", ".join(effect_texts))
+                        st.markdown(f"**{row.name}**")
+                        st.caption(row.caption)
 
                     with col_b:
-                        is_bought = uid in purchased
-                        disabled = is_bought or (g.money < cost)
-                        btn_label = "구매완료" if is_bought else "구입하기"
-
-                        if st.button(btn_label, key=f"upgrade_{uid}", use_container_width=True, disabled=disabled):
-                            g.money -= cost
-                            _apply_upgrade_effects(g, effects)
-                            purchased.add(uid)
-                            push_log(g, f"🛍️ 업그레이드 구매: {name}")
-                            _post_action_checks()
+                        is_bought = row.id in purchased
+                        unlocked = row.unlocked(purchased)
+                        disabled = is_bought or not unlocked or row.cost > g.money
+                        btn_label = "구매완료" if is_bought else ("구입하기" if unlocked else "🔒 잠김")
+
+                        if st.button(btn_label, key=f"upgrade_{row.id}", use_container_width=True, disabled=disabled):
+                            run_action(engine.upgrade(row.index))
                             st.rerun()
 
     st.markdown("</div>", unsafe_allow_html=True)
@@ -398,7 +300,7 @@ with right:
     st.markdown('<div class="pixel-card">', unsafe_allow_html=True)
     st.markdown('<div class="section-title">📌 진행 요약</div>', unsafe_allow_html=True)
 
-    bonuses = _get_upgrade_bonuses()
+    bonuses = g.upgrade_bonuses
     st.markdown(
         f"""
         - **현재 직급:** {g.rank}  
@@ -421,7 +323,7 @@ with right:
 
 
 # =========================================================
-# 6) 하단 도움말
+# 5) 하단 도움말
 # =========================================================
 st.markdown('<div class="pixel-card">', unsafe_allow_html=True)
 st.markdown(
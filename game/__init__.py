@@ -1,10 +1,4 @@
 # ceoparkmake/game/__init__.py
 
-from .balance import (
-    RANKS,
-    PROMOTION_FAIL_LIMIT,
-    DEFAULT_FAIL_LIMIT,
-    BASE_PROMOTION_RATE_BY_RANK,
-    WORK_REWARD_BY_RANK,
-    EXP_REQUIREMENT_BY_RANK,
-)
+from . import balance  # 임포트 시 ranks.json -> 현재 RankTable 설정
+from .ranks import RankTable, get_rank_table
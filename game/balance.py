@@ -2,61 +2,47 @@
 
 # =========================================================
 # 밸런스 규칙 (직급 / 업무 보상 / 승진 확률 / 필요 경험치)
+# - 원본 데이터: data/ranks.json (없거나 깨졌으면 아래 기본값)
+# - 게임 로직은 RankTable(get_rank_table())을 rank_index로 참조
 # =========================================================
 
-RANKS = [
-    "인턴", "계약직", "정규직", "대리", "과장",
-    "차장", "부장", "본부장", "이사", "COO", "CEO"
+from .content_loader import load_ranks
+from .ranks import RankTable, set_rank_table
+
+# ranks.json 기본값 (같은 형식)
+_DEFAULT_RANKS = [
+    {"name": "인턴", "required_exp": 100, "base_promotion_rate": 75, "fail_limit": 1,
+     "work_reward": {"money": 40, "exp": 10, "hp_cost": 8, "mental_cost": 5}},
+    {"name": "계약직", "required_exp": 140, "base_promotion_rate": 65, "fail_limit": 2,
+     "work_reward": {"money": 70, "exp": 14, "hp_cost": 9, "mental_cost": 5}},
+    {"name": "정규직", "required_exp": 180, "base_promotion_rate": 55, "fail_limit": 3,
+     "work_reward": {"money": 110, "exp": 18, "hp_cost": 10, "mental_cost": 6}},
+    {"name": "대리", "required_exp": 240, "base_promotion_rate": 48, "fail_limit": 3,
+     "work_reward": {"money": 180, "exp": 22, "hp_cost": 11, "mental_cost": 7}},
+    {"name": "과장", "required_exp": 300, "base_promotion_rate": 42, "fail_limit": 3,
+     "work_reward": {"money": 280, "exp": 26, "hp_cost": 12, "mental_cost": 8}},
+    {"name": "차장", "required_exp": 360, "base_promotion_rate": 35, "fail_limit": 3,
+     "work_reward": {"money": 420, "exp": 30, "hp_cost": 13, "mental_cost": 9}},
+    {"name": "부장", "required_exp": 440, "base_promotion_rate": 28, "fail_limit": 3,
+     "work_reward": {"money": 650, "exp": 34, "hp_cost": 14, "mental_cost": 10}},
+    {"name": "본부장", "required_exp": 520, "base_promotion_rate": 22, "fail_limit": 3,
+     "work_reward": {"money": 900, "exp": 38, "hp_cost": 15, "mental_cost": 11}},
+    {"name": "이사", "required_exp": 620, "base_promotion_rate": 18, "fail_limit": 3,
+     "work_reward": {"money": 1300, "exp": 42, "hp_cost": 16, "mental_cost": 12}},
+    {"name": "COO", "required_exp": 800, "base_promotion_rate": 12, "fail_limit": 3,
+     "work_reward": {"money": 1800, "exp": 46, "hp_cost": 17, "mental_cost": 13}},
+    {"name": "CEO", "required_exp": 999999, "base_promotion_rate": 100, "fail_limit": 99,  # 종착점
+     "work_reward": {"money": 2500, "exp": 0, "hp_cost": 10, "mental_cost": 8}},
 ]
 
-# 직급별 승진 실패 허용 횟수
-PROMOTION_FAIL_LIMIT = {
-    "인턴": 1,
-    "계약직": 2,
-}
-DEFAULT_FAIL_LIMIT = 3
-
-# 직급별 기본 승진 확률(베이스)
-BASE_PROMOTION_RATE_BY_RANK = {
-    "인턴": 75,
-    "계약직": 65,
-    "정규직": 55,
-    "대리": 48,
-    "과장": 42,
-    "차장": 35,
-    "부장": 28,
-    "본부장": 22,
-    "이사": 18,
-    "COO": 12,
-    "CEO": 100,
-}
-
-# 직급별 업무 보상 / 소모
-WORK_REWARD_BY_RANK = {
-    "인턴": {"money": 40, "exp": 10, "hp_cost": 8, "mental_cost": 5},
-    "계약직": {"money": 70, "exp": 14, "hp_cost": 9, "mental_cost": 5},
-    "정규직": {"money": 110, "exp": 18, "hp_cost": 10, "mental_cost": 6},
-    "대리": {"money": 180, "exp": 22, "hp_cost": 11, "mental_cost": 7},
-    "과장": {"money": 280, "exp": 26, "hp_cost": 12, "mental_cost": 8},
-    "차장": {"money": 420, "exp": 30, "hp_cost": 13, "mental_cost": 9},
-    "부장": {"money": 650, "exp": 34, "hp_cost": 14, "mental_cost": 10},
-    "본부장": {"money": 900, "exp": 38, "hp_cost": 15, "mental_cost": 11},
-    "이사": {"money": 1300, "exp": 42, "hp_cost": 16, "mental_cost": 12},
-    "COO": {"money": 1800, "exp": 46, "hp_cost": 17, "mental_cost": 13},
-    "CEO": {"money": 2500, "exp": 0, "hp_cost": 10, "mental_cost": 8},
-}
-
-# 직급별 승진 필요 경험치
-EXP_REQUIREMENT_BY_RANK = {
-    "인턴": 100,
-    "계약직": 140,
-    "정규직": 180,
-    "대리": 240,
-    "과장": 300,
-    "차장": 360,
-    "부장": 440,
-    "본부장": 520,
-    "이사": 620,
-    "COO": 800,
-    "CEO": 999999,  # 종착점
-}
+DEFAULT_RANK_TABLE = RankTable.from_ranks(_DEFAULT_RANKS)
+
+
+def _load_rank_table() -> RankTable:
+    try:
+        return RankTable.from_ranks(load_ranks())
+    except ValueError:
+        return DEFAULT_RANK_TABLE
+
+
+set_rank_table(_load_rank_table())
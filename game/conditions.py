@@ -0,0 +1,130 @@
+# ceoparkmake/game/conditions.py
+
+"""
+이벤트/엔딩 conditions 컴파일러
+
+JSON의 conditions dict를 로드 시점에 1회 해석해서
+(허용 직급 집합, (필드, 연산자, 기준값) 튜플)로 바꿔둔다.
+형식이 잘못된 조건은 ConditionError로 로드 시점에 걸러낸다.
+직급명은 컴파일 시점의 get_rank_table() 기준 (콘텐츠 빌드는 새 테이블을 고정한 채 컴파일).
+
+지원 키:
+  - rank_is / rank_not: 직급명
+  - rank_in: 직급명 리스트
+  - min_rank / max_rank: 직급명 (범위 포함)
+  - <숫자필드>_gte / _lte / _gt / _lt / _eq: 정수
+"""
+
+import operator
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+from .ranks import get_rank_table
+
+
+class ConditionError(ValueError):
+    """conditions 형식 오류"""
+
+
+# 비교 가능한 GameState 숫자 필드
+NUMERIC_FIELDS = (
+    "retire_count",
+    "company_count",
+    "money",
+    "exp",
+    "promotion_rate",
+    "promotion_fail_count",
+    "hp",
+    "mental",
+    "turn",
+)
+
+_OPS: Dict[str, Callable[[int, int], bool]] = {
+    "gte": operator.ge,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "eq": operator.eq,
+}
+
+class CompiledCondition:
+    """
+    컴파일된 조건 (피클 가능)
+    - ranks: 허용 rank_index 집합
+    - checks: (필드명, 비교함수, 기준값) 튜플
+    - rank_limited: 직급 조건이 실제로 직급을 좁혔는지
+    """
+
+    __slots__ = ("ranks", "checks", "rank_limited")
+
+    def __init__(self, ranks: FrozenSet[int], checks: Tuple[tuple, ...] = (), rank_limited: bool = False):
+        self.ranks = ranks
+        self.checks = checks
+        self.rank_limited = rank_limited
+
+    @property
+    def fields(self) -> FrozenSet[str]:
+        """판정에 쓰이는 GameState 필드 (직급 조건이 있으면 rank_index 포함)"""
+        names = {f for f, _, _ in self.checks}
+        if self.rank_limited:
+            names.add("rank_index")
+        return frozenset(names)
+
+    def __call__(self, g) -> bool:
+        if g.rank_index not in self.ranks:
+            return False
+        for field_name, op, threshold in self.checks:
+            if not op(getattr(g, field_name), threshold):
+                return False
+        return True
+
+
+def _rank_index(names: Tuple[str, ...], name: Any, key: str) -> int:
+    try:
+        return names.index(str(name))
+    except ValueError:
+        raise ConditionError(f"{key}: unknown rank {name!r}") from None
+
+
+def compile_conditions(cond: Optional[Dict[str, Any]]) -> CompiledCondition:
+    """conditions dict -> CompiledCondition (형식 오류면 ConditionError)"""
+    names = get_rank_table().names
+    all_ranks = frozenset(range(len(names)))
+    if not cond:
+        return CompiledCondition(all_ranks)
+    if not isinstance(cond, dict):
+        raise ConditionError(f"conditions must be a dict, got {type(cond).__name__}")
+
+    ranks = set(all_ranks)
+    checks = []
+
+    for key, value in cond.items():
+        if value is None:
+            continue
+
+        if key == "rank_is":
+            ranks &= {_rank_index(names, value, key)}
+        elif key == "rank_not":
+            ranks.discard(_rank_index(names, value, key))
+        elif key == "rank_in":
+            if not isinstance(value, list):
+                raise ConditionError("rank_in must be a list")
+            ranks &= {_rank_index(names, v, key) for v in value}
+        elif key == "min_rank":
+            lo = _rank_index(names, value, key)
+            ranks = {i for i in ranks if i >= lo}
+        elif key == "max_rank":
+            hi = _rank_index(names, value, key)
+            ranks = {i for i in ranks if i <= hi}
+        else:
+            field_name, _, op_name = key.rpartition("_")
+            if field_name not in NUMERIC_FIELDS or op_name not in _OPS:
+                raise ConditionError(f"unknown condition key {key!r}")
+            if isinstance(value, bool):
+                raise ConditionError(f"{key}: expected int, got bool")
+            try:
+                threshold = int(value)
+            except (TypeError, ValueError):
+                raise ConditionError(f"{key}: expected int, got {value!r}") from None
+            checks.append((field_name, _OPS[op_name], threshold))
+
+    return CompiledCondition(frozenset(ranks), tuple(checks), ranks != all_ranks)
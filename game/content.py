@@ -0,0 +1,346 @@
+# ceoparkmake/game/content.py
+
+"""
+콘텐츠 스냅샷 (data/*.json 5종을 한 번에 로드/검증)
+
+- get_content(): 프로세스 전역 캐시 (Streamlit 없이도 사용)
+- 파일 mtime이 바뀐 경우에만 다시 읽는다
+- start_content_watcher(): 백그라운드 감시 -> 검증 후 스냅샷 통째로 교체 (핫 리로드)
+- 콘텐츠 팩(data/content.pack): 검증/컴파일까지 끝난 스냅샷을 피클로 저장해 둔 것.
+  소스와 일치하면 JSON 파싱 없이 바로 로드한다.
+
+팩 빌드:
+  python -m game.content build-pack
+"""
+
+import argparse
+import dataclasses
+import hashlib
+import os
+import pickle
+import threading
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import content_loader
+from .logic import EventIndex, EndingTable
+from .ranks import RankTable, get_rank_table, pinned_rank_table, set_rank_table
+from .upgrades import UpgradeCatalog, UpgradeRow
+
+
+CONTENT_FILES = (
+    "ranks.json",
+    "events_dialogue.json",
+    "events_adventure.json",
+    "upgrades.json",
+    "endings.json",
+)
+
+
+@dataclass(frozen=True)
+class ContentSnapshot:
+    ranks: Tuple[Dict[str, Any], ...]
+    rank_table: RankTable
+    dialogue_events: EventIndex
+    adventure_events: EventIndex
+    upgrades: Dict[str, Tuple[Dict[str, Any], ...]]  # 카테고리 -> 아이템
+    upgrade_catalog: UpgradeCatalog
+    endings: EndingTable
+    events_by_id: Dict[str, Dict[str, Any]]  # 대화/모험 이벤트 id -> 이벤트
+    mtimes: Tuple[float, ...]  # CONTENT_FILES 순서
+    errors: Tuple[str, ...]  # 검증에서 제외된 항목
+    retired_events: Dict[str, int] = dataclasses.field(default_factory=dict)  # 빠진 이벤트 id -> 지난 리로드 수
+
+    def event(self, event_id: str) -> Optional[Dict[str, Any]]:
+        return self.events_by_id.get(event_id)
+
+    def upgrade_list(self) -> Tuple[Dict[str, Any], ...]:
+        """카테고리 순서로 펼친 업그레이드 (행동 저널의 업그레이드 번호 기준)"""
+        return tuple(row.item for row in self.upgrade_catalog.rows)
+
+    def upgrade_at(self, index: int) -> Optional[UpgradeRow]:
+        return self.upgrade_catalog.at(index)
+
+    def upgrade_index(self, upgrade_id: str) -> int:
+        row = self.upgrade_catalog.get(upgrade_id)
+        if row is None:
+            raise KeyError(upgrade_id)
+        return row.index
+
+
+def content_ref(content_id: str) -> int:
+    """콘텐츠 id -> 4바이트 참조값 (세션 스냅샷용, 0은 '없음'으로 예약)"""
+    return zlib.crc32(content_id.encode("utf-8")) or 1
+
+
+def ref_collisions(kind: str, ids) -> List[str]:
+    """같은 참조값을 갖는 id 쌍 (스냅샷 복원 시 구분 불가)"""
+    seen: Dict[int, str] = {}
+    errors = []
+    for cid in ids:
+        other = seen.setdefault(content_ref(cid), cid)
+        if other != cid:
+            errors.append(f"{cid}: {kind} reference collides with {other}; rename one")
+    return errors
+
+
+def _source_mtimes() -> Tuple[float, ...]:
+    mtimes = []
+    for name in CONTENT_FILES:
+        path = content_loader.DATA_DIR / name
+        try:
+            mtimes.append(path.stat().st_mtime)
+        except OSError:
+            mtimes.append(0.0)
+    return tuple(mtimes)
+
+
+def build_snapshot(mtimes: Optional[Tuple[float, ...]] = None) -> ContentSnapshot:
+    """data/*.json을 읽어 스냅샷 생성 (mtime은 읽기 전에 잡아서 그 사이 변경도 다음에 감지)"""
+    if mtimes is None:
+        mtimes = _source_mtimes()
+
+    errors: List[str] = []
+    ranks = content_loader.load_ranks()
+    try:
+        rank_table = RankTable.from_ranks(ranks)
+    except ValueError as exc:
+        errors.append(f"ranks.json: {exc}")
+        rank_table = get_rank_table()
+
+    # 직급명 조건 / 직급별 버킷은 이 스냅샷의 직급 테이블 기준으로 컴파일
+    with pinned_rank_table(rank_table):
+        dialogue = EventIndex(content_loader.load_dialogue_events())
+        adventure = EventIndex(content_loader.load_adventure_events())
+        endings = EndingTable(content_loader.load_endings())
+
+    events_by_id: Dict[str, Dict[str, Any]] = {}
+    errors += list(dialogue.errors) + list(adventure.errors) + list(endings.errors)
+    for e in dialogue.events + adventure.events:
+        if e["id"] in events_by_id:
+            errors.append(f"{e['id']}: duplicate event id")
+            continue
+        events_by_id[e["id"]] = e
+
+    upgrades = {
+        str(cat): tuple(item for item in items if isinstance(item, dict))
+        for cat, items in content_loader.load_upgrades().items()
+        if isinstance(items, list)
+    }
+    upgrade_catalog = UpgradeCatalog(upgrades)
+    errors += upgrade_catalog.errors
+
+    # 세션 스냅샷은 id를 crc32로 참조 -> 충돌은 여기서 알리고 복원 시에는 양쪽 다 버린다
+    errors += ref_collisions("event", events_by_id)
+    errors += ref_collisions("ending", (e["id"] for e in endings.endings if isinstance(e.get("id"), str)))
+    errors += ref_collisions("upgrade", (row.id for row in upgrade_catalog.rows if row.id))
+
+    return ContentSnapshot(
+        ranks=tuple(ranks),
+        rank_table=rank_table,
+        dialogue_events=dialogue,
+        adventure_events=adventure,
+        upgrades=upgrades,
+        upgrade_catalog=upgrade_catalog,
+        endings=endings,
+        events_by_id=events_by_id,
+        mtimes=mtimes,
+        errors=tuple(errors),
+    )
+
+
+# -------------------------
+# 콘텐츠 팩
+# -------------------------
+PACK_VERSION = 6
+PACK_PATH = content_loader.DATA_DIR / "content.pack"
+
+
+def content_hash() -> str:
+    """소스 JSON 5종의 sha256 (파일 순서 고정)"""
+    h = hashlib.sha256()
+    for name in CONTENT_FILES:
+        path = content_loader.DATA_DIR / name
+        h.update(name.encode("utf-8") + b"\0")
+        try:
+            h.update(path.read_bytes())
+        except OSError:
+            pass
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def build_pack(path: Path = PACK_PATH) -> Tuple[Path, ContentSnapshot, str]:
+    """스냅샷을 빌드해서 팩으로 저장 (임시 파일 -> rename 으로 원자적 교체)"""
+    mtimes = _source_mtimes()
+    digest = content_hash()
+    snap = build_snapshot(mtimes)
+
+    payload = {"version": PACK_VERSION, "hash": digest, "snapshot": snap}
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+    return path, snap, digest
+
+
+def load_pack(mtimes: Tuple[float, ...], path: Path = PACK_PATH) -> Optional[ContentSnapshot]:
+    """
+    팩이 현재 소스와 같으면 스냅샷 반환, 아니면 None
+    - 빌드 당시 소스 mtime이 그대로면 바로 사용
+    - mtime만 바뀐 경우(배포/체크아웃)는 content hash가 같을 때만 사용
+    팩은 직접 빌드한 신뢰할 수 있는 파일만 둔다 (pickle)
+    """
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+    if not isinstance(payload, dict) or payload.get("version") != PACK_VERSION:
+        return None
+    snap = payload.get("snapshot")
+    if not isinstance(snap, ContentSnapshot):
+        return None
+
+    if snap.mtimes == mtimes:
+        return snap
+    if payload.get("hash") == content_hash():
+        return dataclasses.replace(snap, mtimes=mtimes)
+    return None
+
+
+# -------------------------
+# 프로세스 전역 캐시 / 핫 리로드
+# -------------------------
+_lock = threading.Lock()
+_current: Optional[ContentSnapshot] = None
+_watcher: Optional["ContentWatcher"] = None
+
+# 빠진 이벤트를 id 조회용으로 남겨 두는 리로드 횟수
+RETIRED_EVENT_RELOADS = 5
+
+
+def validate_snapshot(snap: ContentSnapshot, prev: Optional[ContentSnapshot]) -> List[str]:
+    """교체를 막아야 하는 문제 목록 (비어 있으면 교체 가능)"""
+    problems = []
+    if snap.rank_table.names != get_rank_table().names:
+        problems.append("ranks.json: rank names changed; restart required")
+    if prev is not None:
+        for name in ("dialogue_events", "adventure_events", "endings"):
+            if len(getattr(prev, name)) and not len(getattr(snap, name)):
+                problems.append(f"{name}: empty after reload")
+    return problems
+
+
+def _reload(mtimes: Tuple[float, ...]) -> bool:
+    """
+    새 스냅샷 빌드 -> 검증 -> 교체 (_lock 안에서 호출)
+    - 검증 실패 시 기존 스냅샷 유지 (같은 파일로 재시도하지 않게 mtimes만 갱신)
+    - 새 콘텐츠에서 빠진 이벤트도 RETIRED_EVENT_RELOADS번의 리로드 동안은 id로 찾을 수 있게 남긴다
+      (진행 중인 세션의 pending 이벤트 보호, 새로 뽑히지는 않음)
+    """
+    global _current
+    prev = _current
+    snap = load_pack(mtimes) or build_snapshot(mtimes)
+
+    problems = validate_snapshot(snap, prev)
+    if problems and prev is not None:
+        _current = dataclasses.replace(prev, mtimes=mtimes, errors=prev.errors + tuple(problems))
+        return False
+
+    if prev is not None:
+        kept, ages = {}, {}
+        for k, e in prev.events_by_id.items():
+            if k in snap.events_by_id:
+                continue
+            age = prev.retired_events.get(k, 0) + 1
+            if age <= RETIRED_EVENT_RELOADS:
+                kept[k] = e
+                ages[k] = age
+        if kept:
+            snap = dataclasses.replace(snap, events_by_id={**kept, **snap.events_by_id}, retired_events=ages)
+
+    set_rank_table(snap.rank_table)
+    _current = snap  # 참조 교체 한 번 = 원자적
+    return True
+
+
+def check_for_updates() -> bool:
+    """소스 mtime이 바뀌었으면 다시 로드 (교체했으면 True)"""
+    mtimes = _source_mtimes()
+    if _current is not None and _current.mtimes == mtimes:
+        return False
+    with _lock:
+        if _current is not None and _current.mtimes == mtimes:
+            return False
+        return _reload(mtimes)
+
+
+def get_content() -> ContentSnapshot:
+    """
+    현재 콘텐츠 스냅샷
+    - 감시 스레드가 돌고 있으면 그대로 반환 (교체는 스레드가 담당)
+    - 아니면 호출 시 mtime 확인 후 필요하면 팩 -> JSON 순으로 다시 로드
+    새 스냅샷의 직급 테이블은 get_rank_table()에도 반영된다
+    """
+    snap = _current
+    if snap is not None and _watcher is not None and _watcher.is_alive():
+        return snap
+    check_for_updates()
+    return _current
+
+
+class ContentWatcher(threading.Thread):
+    """data/*.json mtime을 주기적으로 보고 바뀌면 백그라운드에서 스냅샷 교체"""
+
+    def __init__(self, interval: float = 2.0):
+        super().__init__(name="content-watcher", daemon=True)
+        self.interval = interval
+        self.last_error: Optional[str] = None
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                check_for_updates()
+            except Exception as exc:  # 감시 스레드는 죽지 않게
+                self.last_error = repr(exc)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+def start_content_watcher(interval: float = 2.0) -> ContentWatcher:
+    """감시 스레드 시작 (이미 돌고 있으면 그 스레드 반환)"""
+    global _watcher
+    with _lock:
+        if _watcher is None or not _watcher.is_alive():
+            _watcher = ContentWatcher(interval)
+            _watcher.start()
+        watcher = _watcher
+    check_for_updates()
+    return watcher
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="ceoparkmake 콘텐츠 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build-pack", help="data/*.json -> 콘텐츠 팩")
+    build.add_argument("--out", type=Path, default=PACK_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "build-pack":
+        path, snap, digest = build_pack(args.out)
+        print(f"{path} (v{PACK_VERSION}, sha256 {digest[:12]})")
+        for err in snap.errors:
+            print(f"  제외: {err}")
+
+
+if __name__ == "__main__":
+    # -m 실행 시 스냅샷 클래스가 __main__ 소속으로 피클되지 않도록 패키지 모듈 쪽 main 호출
+    from game.content import main as _main
+
+    _main()
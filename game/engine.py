@@ -0,0 +1,263 @@
+# ceoparkmake/game/engine.py
+
+"""
+턴 진행 리듀서 (Streamlit 없이 게임 1턴 전체 파이프라인)
+
+  state, outcome = step(state, action, content)
+
+행동 -> 이벤트 발생 판정 -> 강제퇴사 -> 엔딩 판정까지 한 번에.
+app.py / 시뮬레이션 / 저널 재생이 모두 이 함수만 거친다.
+
+- state는 제자리에서 바뀌고, 퇴사하면 새 GameState가 반환된다 (항상 반환값을 쓸 것)
+- rng=None: 행동 저널에 기록하고 seed/행동 번호로 재시드 (재생 가능, 앱 기본)
+- rng 지정: 저널 없이 그 RNG로 진행 (배치 시뮬레이션용)
+"""
+
+import random
+from dataclasses import dataclass
+from typing import NamedTuple, Optional, Tuple, Union
+
+from .content import ContentSnapshot, get_content
+from .logic import (
+    check_endings_incremental,
+    check_for_forced_retirement,
+    do_part_time,
+    do_rest,
+    do_work,
+    maybe_trigger_adventure_event,
+    maybe_trigger_dialogue_event,
+    resolve_pending_event_choice,
+    retire_and_rehire,
+    try_promotion,
+)
+from .ranks import get_pinned_rank_table, pinned_rank_table
+from .state import (
+    ACTION_CHOICE,
+    ACTION_CODES,
+    ACTION_PART_TIME,
+    ACTION_PROMOTE,
+    ACTION_REST,
+    ACTION_UPGRADE,
+    ACTION_WORK,
+    GameState,
+    begin_action,
+    init_game_state,
+    iter_journal,
+    push_log,
+)
+from .upgrades import purchase_upgrade
+
+
+class Action(NamedTuple):
+    code: int
+    arg: int = 0  # 선택지 번호 / 업그레이드 번호
+
+
+WORK = Action(ACTION_WORK)
+REST = Action(ACTION_REST)
+PART_TIME = Action(ACTION_PART_TIME)
+PROMOTE = Action(ACTION_PROMOTE)
+
+
+def choice(idx: int) -> Action:
+    return Action(ACTION_CHOICE, idx)
+
+
+def upgrade(index: int) -> Action:
+    """index: ContentSnapshot.upgrade_list() 기준 번호"""
+    return Action(ACTION_UPGRADE, index)
+
+
+# 행동 후 이벤트 발생 확률 (대화, 모험) - 모험은 대화가 안 떴을 때만
+EVENT_CHANCES = {
+    ACTION_WORK: (0.35, 0.20),
+    ACTION_REST: (0.18, 0.0),
+    ACTION_PART_TIME: (0.15, 0.0),
+    ACTION_PROMOTE: (0.25, 0.0),
+}
+
+
+@dataclass(slots=True)
+class Outcome:
+    action: Action
+    retire_reason: Optional[str] = None  # 이번 턴에 퇴사(-> 재입사)했으면 사유
+    promoted: bool = False
+    purchased: bool = False
+    event_id: Optional[str] = None  # 이번 턴에 새로 뜬 이벤트
+    ending_id: Optional[str] = None  # 이번 턴에 처음 달성한 엔딩
+
+
+def _trigger_events(g: GameState, code: int, content: ContentSnapshot) -> None:
+    dialogue_chance, adventure_chance = EVENT_CHANCES[code]
+    if maybe_trigger_dialogue_event(g, content.dialogue_events, chance=dialogue_chance):
+        return
+    if adventure_chance:
+        maybe_trigger_adventure_event(g, content.adventure_events, chance=adventure_chance)
+
+
+def step(
+    state: GameState,
+    action: Union[Action, str],
+    content: Optional[ContentSnapshot] = None,
+    rng: Optional[random.Random] = None,
+) -> Tuple[GameState, Outcome]:
+    """
+    행동 1회 전체 처리
+    action: Action 또는 행동 이름("work" / "rest" / "part_time" / "promote")
+    직급 테이블은 content.rank_table로 고정 (처리 도중 핫 리로드가 끼어들어도 한 테이블만 사용)
+    """
+    if content is None:
+        content = get_content()
+    if isinstance(action, str):
+        action = Action(ACTION_CODES[action])
+    table = content.rank_table
+    if get_pinned_rank_table() is table:  # 이미 고정됨 (시뮬레이션 루프 / 자동 진행)
+        return _step(state, action, content, rng)
+    with pinned_rank_table(table):
+        return _step(state, action, content, rng)
+
+
+def _step(
+    state: GameState,
+    action: Action,
+    content: ContentSnapshot,
+    rng: Optional[random.Random],
+) -> Tuple[GameState, Outcome]:
+    g = state
+    code, arg = action
+    if rng is None:
+        begin_action(g, code, arg)
+    else:
+        g.rng = rng
+
+    out = Outcome(action)
+    retire_reason = None
+
+    if code == ACTION_WORK:
+        do_work(g)
+    elif code == ACTION_REST:
+        do_rest(g)
+    elif code == ACTION_PART_TIME:
+        retire_reason = do_part_time(g)
+    elif code == ACTION_PROMOTE:
+        prev_rank = g.rank_index
+        success, retire_reason = try_promotion(g)
+        out.promoted = g.rank_index > prev_rank
+        if success and not retire_reason:
+            push_log(g, "✨ 회사 공기가 조금 달라진 것 같다.")
+    elif code == ACTION_CHOICE:
+        retire_reason = resolve_pending_event_choice(g, arg)
+    elif code == ACTION_UPGRADE:
+        row = content.upgrade_at(arg)
+        if row is not None and row.unlocked(g.purchased_upgrades):
+            out.purchased = purchase_upgrade(g, row.item)
+    else:
+        raise ValueError(f"unknown action code: {code}")
+
+    if retire_reason:
+        g = retire_and_rehire(g, retire_reason)
+    elif code in EVENT_CHANCES:
+        had_event = g.pending_event is not None
+        _trigger_events(g, code, content)
+        if not had_event and g.pending_event is not None:
+            out.event_id = g.pending_event.get("id")
+
+    # 체력/멘탈 바닥 퇴사
+    if not retire_reason:
+        retire_reason = check_for_forced_retirement(g)
+        if retire_reason:
+            g = retire_and_rehire(g, retire_reason)
+    out.retire_reason = retire_reason
+
+    # 엔딩 판정 (최초 1회만)
+    if g.triggered_ending_id is None:
+        ending = check_endings_incremental(g, content.endings)
+        if ending:
+            g.triggered_ending_id = out.ending_id = ending.get("id")
+
+    return g, out
+
+
+def replay_journal(seed: int, journal: bytes, content: Optional[ContentSnapshot] = None) -> GameState:
+    """seed + 행동 저널 -> 최종 GameState (같은 콘텐츠면 비트 단위로 동일)"""
+    if content is None:
+        content = get_content()
+    g = init_game_state(seed)
+    for code, arg in iter_journal(journal):
+        g, _ = step(g, Action(code, arg), content)
+    return g
+
+
+# -------------------------
+# 자동 진행 (N턴을 한 번에)
+# -------------------------
+AUTO_PLAY_MAX_TURNS = 100
+
+# 멈춘 이유
+STOP_DONE = "done"  # N턴 모두 진행
+STOP_EVENT = "event"  # 이벤트 선택 대기
+STOP_PROMOTION = "promotion"  # 승진 시도 가능
+STOP_RETIRED = "retired"  # 퇴사 -> 재입사
+STOP_ENDING = "ending"  # 엔딩 달성
+
+
+@dataclass(slots=True)
+class AutoPlayResult:
+    turns: int
+    stop_reason: str
+
+
+def auto_play(
+    state: GameState,
+    turns: int,
+    content: Optional[ContentSnapshot] = None,
+    hp_min: int = 30,
+    mental_min: int = 30,
+) -> Tuple[GameState, AutoPlayResult]:
+    """
+    업무/휴식을 최대 turns턴 연속 진행 (각 턴은 step과 동일하게 저널 기록)
+    - 체력/멘탈이 기준 미만이면 휴식, 아니면 업무
+    - 이벤트 발생 / 승진 가능 / 퇴사 / 엔딩 달성 시 멈춘다
+    """
+    if content is None:
+        content = get_content()
+
+    with pinned_rank_table(content.rank_table):
+        return _auto_play(state, turns, content, hp_min, mental_min)
+
+
+def _auto_play(
+    state: GameState,
+    turns: int,
+    content: ContentSnapshot,
+    hp_min: int,
+    mental_min: int,
+) -> Tuple[GameState, AutoPlayResult]:
+    g = state
+    played = 0
+    stop = STOP_DONE
+    for _ in range(min(turns, AUTO_PLAY_MAX_TURNS)):
+        if g.pending_event is not None:
+            stop = STOP_EVENT
+            break
+        if g.can_try_promotion:
+            stop = STOP_PROMOTION
+            break
+
+        action = REST if (g.hp < hp_min or g.mental < mental_min) else WORK
+        g, out = step(g, action, content)
+        played += 1
+
+        if out.ending_id:
+            stop = STOP_ENDING
+            break
+        if out.retire_reason:
+            stop = STOP_RETIRED
+            break
+    else:
+        if g.pending_event is not None:
+            stop = STOP_EVENT
+        elif g.can_try_promotion:
+            stop = STOP_PROMOTION
+
+    return g, AutoPlayResult(played, stop)
@@ -1,13 +1,8 @@
 # ceoparkmake/game/events.py
 
-import json
-from pathlib import Path
 from typing import List, Dict, Any
 
-
-# 프로젝트 루트 기준 data 경로 추정
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-DATA_DIR = PROJECT_ROOT / "data"
+from . import content_loader
 
 
 def _fallback_dialogue_events() -> List[Dict[str, Any]]:
@@ -57,24 +52,9 @@ def _fallback_dialogue_events() -> List[Dict[str, Any]]:
 
 
 def load_dialogue_events() -> List[Dict[str, Any]]:
-    path = DATA_DIR / "events_dialogue.json"
-
-    if not path.exists():
-        return _fallback_dialogue_events()
-
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            obj = json.load(f)
-
-        # 스키마: {"events": [...]}
-        events = obj.get("events", [])
-        if isinstance(events, list) and len(events) > 0:
-            return events
-
-        return _fallback_dialogue_events()
-
-    except Exception:
-        return _fallback_dialogue_events()
+    """game.content_loader와 같은 파일 + 비어있으면 기본 이벤트"""
+    events = content_loader.load_dialogue_events()
+    return events if events else _fallback_dialogue_events()
 
 
 def pick_random_dialogue_event(events: List[Dict[str, Any]]):
@@ -1,46 +1,48 @@
 # ceoparkmake/game/logic.py
 
-import random
+import operator
+from bisect import bisect_left, bisect_right
 from typing import Dict, Any, List, Tuple, Optional
 
-from .balance import (
-    RANKS,
-    WORK_REWARD_BY_RANK,
-    BASE_PROMOTION_RATE_BY_RANK,
-)
+from .conditions import ConditionError, compile_conditions
+from .ranks import get_rank_table
+from .sampling import AliasTable
 from .state import GameState, clamp_stats, push_log, apply_effects, reset_for_rehire
+from .upgrades import work_reward
 
 
 # -------------------------
 # 기본 액션
 # -------------------------
 def do_work(g: GameState) -> None:
-    reward = WORK_REWARD_BY_RANK[g.rank]
+    g.turn += 1
+    reward = work_reward(g)  # 업그레이드 보너스 포함
 
-    g.money += reward["money"]
-    g.exp += reward["exp"]
-    g.hp -= reward["hp_cost"]
-    g.mental -= reward["mental_cost"]
+    g.money += reward.money
+    g.exp += reward.exp
+    g.hp -= reward.hp_cost
+    g.mental -= reward.mental_cost
 
     # 소소한 랜덤 보정
-    if random.random() < 0.15:
-        bonus = random.randint(10, 40)
+    if g.rng.random() < 0.15:
+        bonus = g.rng.randint(10, 40)
         g.money += bonus
         push_log(g, f"📎 업무 효율 보너스! +{bonus}원")
 
-    push_log(g, f"💼 업무 처리: 돈 +{reward['money']} / 경력 +{reward['exp']}")
+    push_log(g, f"💼 업무 처리: 돈 +{reward.money} / 경력 +{reward.exp}")
     clamp_stats(g)
 
 
 def do_rest(g: GameState) -> None:
-    hp_gain = random.randint(10, 18)
-    mental_gain = random.randint(8, 14)
+    g.turn += 1
+    hp_gain = g.rng.randint(10, 18)
+    mental_gain = g.rng.randint(8, 14)
 
     g.hp += hp_gain
     g.mental += mental_gain
 
     # 두붕 산책 감성 로그
-    if random.random() < 0.4:
+    if g.rng.random() < 0.4:
         push_log(g, f"🐶 {g.dog_name}과 산책했다. 마음이 조금 편해졌다.")
     else:
         push_log(g, "☕ 잠깐 쉬었다. 호흡을 가다듬었다.")
@@ -54,8 +56,9 @@ def do_part_time(g: GameState) -> Optional[str]:
     - 소액 돈 / 소량 exp 보상
     - 낮은 확률로 퇴사 이벤트
     """
-    money_gain = random.randint(300, 600)
-    exp_gain = random.randint(5, 20)
+    g.turn += 1
+    money_gain = g.rng.randint(300, 600)
+    exp_gain = g.rng.randint(5, 20)
 
     g.money += money_gain
     g.exp += exp_gain
@@ -65,7 +68,7 @@ def do_part_time(g: GameState) -> Optional[str]:
     push_log(g, f"🎬 알바 완료: 돈 +{money_gain} / 경력 +{exp_gain}")
 
     # 5% 퇴사 리스크
-    if random.random() < 0.05:
+    if g.rng.random() < 0.05:
         reason = "투잡 뛰다 걸렸다!!"
         push_log(g, f"⚠️ {reason}")
         return reason
@@ -77,14 +80,29 @@ def do_part_time(g: GameState) -> Optional[str]:
 # -------------------------
 # 이벤트 관련 (중복 방지 + 조건 지원)
 # -------------------------
-def _ensure_event_runtime_fields(g: GameState) -> None:
-    """GameState dataclass를 안 바꾸고 런타임 필드만 동적으로 붙인다."""
-    if not hasattr(g, "recent_event_ids"):
-        g.recent_event_ids = []  # type: ignore[attr-defined]
+def _normalize_event(event: Any) -> Any:
+    """
+    대화 이벤트 선택지 형식({text, result_text})을 공통 형식({label, result})으로 맞춘 사본
+    (이미 공통 형식이면 그대로 반환)
+    """
+    if not isinstance(event, dict) or not isinstance(event.get("choices"), list):
+        return event
+    choices = event["choices"]
+    if not any(isinstance(ch, dict) and "label" not in ch and "text" in ch for ch in choices):
+        return event
+
+    normalized = []
+    for ch in choices:
+        if isinstance(ch, dict) and "label" not in ch and "text" in ch:
+            ch = dict(ch, label=ch["text"])
+            if "result" not in ch and "result_text" in ch:
+                ch["result"] = ch["result_text"]
+        normalized.append(ch)
+    return dict(event, choices=normalized)
 
 
 def _is_valid_event(event: Dict[str, Any]) -> bool:
-    """최소 스키마 검증 (깨진 이벤트는 스킵)"""
+    """최소 스키마 검증 (깨진 이벤트는 스킵, 선택지는 _normalize_event 이후 기준)"""
     if not isinstance(event, dict):
         return False
 
@@ -112,121 +130,193 @@ def _is_valid_event(event: Dict[str, Any]) -> bool:
     return True
 
 
-def _event_matches_conditions(g: GameState, event: Dict[str, Any]) -> bool:
-    """
-    events_* JSON의 선택적 conditions 지원
-    예:
-      "conditions": {
-        "rank_is": "대리",
-        "retire_count_gte": 3,
-        "money_gte": 1000
-      }
-    """
-    cond = event.get("conditions", {})
-    if not cond:
-        return True
-    if not isinstance(cond, dict):
-        return True  # 잘못 들어와도 게임 안 깨지게 통과(원하면 False로 바꿔도 됨)
-
-    # rank 조건
-    rank_is = cond.get("rank_is")
-    if rank_is is not None and g.rank != str(rank_is):
-        return False
+# 쿨다운이 없는 이벤트(모험 등)의 기본 재등장 제한 (턴)
+DEFAULT_EVENT_COOLDOWN = 4
 
-    rank_in = cond.get("rank_in")
-    if rank_in is not None:
-        if not isinstance(rank_in, list):
-            return False
-        if g.rank not in [str(x) for x in rank_in]:
-            return False
+# EventIndex별 알리아스 테이블 캐시 상한
+_ALIAS_CACHE_LIMIT = 256
 
-    rank_not = cond.get("rank_not")
-    if rank_not is not None and g.rank == str(rank_not):
-        return False
+# 쿨다운 중인 이벤트가 뽑혔을 때 다시 뽑는 최대 횟수 (넘으면 쿨다운 아닌 후보를 직접 추림)
+COOLDOWN_REDRAWS = 8
 
-    # 숫자 조건
-    def _gte(field_name: str, current_val: int) -> bool:
-        if cond.get(field_name) is None:
-            return True
-        try:
-            return current_val >= int(cond[field_name])
-        except Exception:
-            return False
 
-    def _lte(field_name: str, current_val: int) -> bool:
-        if cond.get(field_name) is None:
-            return True
-        try:
-            return current_val <= int(cond[field_name])
-        except Exception:
-            return False
+def _event_weight(event: Dict[str, Any]) -> float:
+    try:
+        return max(0.0, float(event.get("weight", 1)))
+    except (TypeError, ValueError):
+        return 1.0
 
-    if not _gte("retire_count_gte", g.retire_count):
-        return False
-    if not _gte("company_count_gte", g.company_count):
-        return False
-    if not _gte("money_gte", g.money):
-        return False
-    if not _lte("money_lte", g.money):
-        return False
-    if not _gte("exp_gte", g.exp):
-        return False
-    if not _gte("promotion_rate_gte", g.promotion_rate):
-        return False
 
-    return True
+def _event_cooldown(event: Dict[str, Any]) -> int:
+    try:
+        return max(0, int(event.get("cooldown", DEFAULT_EVENT_COOLDOWN)))
+    except (TypeError, ValueError):
+        return DEFAULT_EVENT_COOLDOWN
+
+
+class EventIndex:
+    """
+    콘텐츠 로드 시 1회 빌드하는 이벤트 인덱스
+    - 깨진 스키마 이벤트는 빌드 시점에 제외
+    - 직급 조건(rank_is/rank_in/rank_not, min_rank/max_rank)은 직급별 버킷으로 미리 분류
+    - 호출 시에는 버킷 + 남은 숫자 조건만 검사
+    - weight 가중 추출은 조건 통과 집합별 알리아스 테이블 (조건 통과 집합이 바뀔 때만 새로 빌드)
+      쿨다운은 테이블에 넣지 않고 뽑은 뒤 거절 -> 다시 뽑기로 처리
+    """
+
+    __slots__ = ("events", "weights", "cooldowns", "tags", "errors", "_always", "_checked", "_alias_cache")
+
+    def __init__(self, events: List[Dict[str, Any]]):
+        n_ranks = len(get_rank_table())
+        always: List[List[int]] = [[] for _ in range(n_ranks)]
+        checked: List[List[Tuple[int, tuple]]] = [[] for _ in range(n_ranks)]
+        kept = []
+        errors = []
+
+        for e in events or []:
+            e = _normalize_event(e)
+            if not _is_valid_event(e):
+                errors.append(f"{e.get('id') if isinstance(e, dict) else repr(e)}: invalid event schema")
+                continue
+            try:
+                cond = compile_conditions(e.get("conditions"))
+                # 이벤트 최상위 min_rank/max_rank도 conditions와 같은 규칙으로 (모르는 직급명은 오류)
+                bounds = compile_conditions({"min_rank": e.get("min_rank"), "max_rank": e.get("max_rank")})
+            except ConditionError as exc:
+                errors.append(f"{e['id']}: {exc}")
+                continue
+
+            pos = len(kept)
+            kept.append(e)
+            for ri in cond.ranks & bounds.ranks:
+                if cond.checks:
+                    checked[ri].append((pos, cond.checks))
+                else:
+                    always[ri].append(pos)
+
+        self.events = tuple(kept)
+        self.weights = tuple(_event_weight(e) for e in kept)
+        self.cooldowns = tuple(_event_cooldown(e) for e in kept)
+        self.tags = tuple(frozenset(e.get("tags") or ()) for e in kept)
+        self.errors = tuple(errors)  # 스키마/조건 오류로 제외된 이벤트
+        self._always = tuple(tuple(b) for b in always)
+        self._checked = tuple(tuple(b) for b in checked)
+        self._alias_cache: Dict[tuple, AliasTable] = {}
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def eligible_positions(self, g: GameState) -> List[int]:
+        """현재 상태에서 조건을 만족하는 이벤트 위치(self.events 인덱스)"""
+        pool = list(self._always[g.rank_index])
+        for pos, checks in self._checked[g.rank_index]:
+            for field_name, op, threshold in checks:
+                if not op(getattr(g, field_name), threshold):
+                    break
+            else:
+                pool.append(pos)
+        return pool
+
+    def eligible(self, g: GameState) -> List[Dict[str, Any]]:
+        """현재 상태에서 조건을 만족하는 이벤트 목록"""
+        return [self.events[pos] for pos in self.eligible_positions(g)]
+
+    def alias_for(self, pool: List[int], tag_boosts: Optional[Dict[str, float]] = None) -> AliasTable:
+        """조건 통과 집합(+태그 부스트)별 알리아스 테이블 (쿨다운으로 거른 목록을 넘기지 말 것)"""
+        boost_key = tuple(sorted(tag_boosts.items())) if tag_boosts else ()
+        key = (tuple(pool), boost_key)
+        table = self._alias_cache.get(key)
+        if table is None:
+            weights = [self.weights[pos] for pos in pool]
+            if tag_boosts:
+                for i, pos in enumerate(pool):
+                    for tag in self.tags[pos]:
+                        weights[i] *= tag_boosts.get(tag, 1.0)
+            if len(self._alias_cache) >= _ALIAS_CACHE_LIMIT:
+                self._alias_cache.clear()
+            table = self._alias_cache[key] = AliasTable(weights)
+        return table
+
+
+def _as_event_index(events) -> EventIndex:
+    if isinstance(events, EventIndex):
+        return events
+    return EventIndex(events)
+
+
+def _weighted_pick(
+    g: GameState,
+    index: EventIndex,
+    pool: List[int],
+    tag_boosts: Optional[Dict[str, float]] = None,
+) -> int:
+    """pool에서 weight(x 태그 부스트) 가중 추출 (선형, 알리아스 캐시에 넣지 않는 드문 경로용)"""
+    weights = []
+    for pos in pool:
+        w = index.weights[pos]
+        if tag_boosts:
+            for tag in index.tags[pos]:
+                w *= tag_boosts.get(tag, 1.0)
+        weights.append(w)
+    if sum(weights) <= 0:
+        return g.rng.choice(pool)
+    return g.rng.choices(pool, weights)[0]
 
 
 def _pick_event_with_rules(
     g: GameState,
-    events: List[Dict[str, Any]],
-    recent_limit: int = 4,
+    events,
+    tag_boosts: Optional[Dict[str, float]] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     규칙:
     1) 깨진 스키마 이벤트 제외
-    2) conditions 불만족 이벤트 제외
-    3) 최근 이벤트(recent_event_ids) 제외 우선
-    4) 후보 없으면 최근 제외 규칙만 풀고 재시도
-    """
-    _ensure_event_runtime_fields(g)
-
-    valid_events = [e for e in events if _is_valid_event(e)]
-    if not valid_events:
-        return None
+    2) conditions 불만족 이벤트 제외 (형식 오류 이벤트는 빌드 시점에 제외)
+    3) 남은 후보에서 weight(x 태그 부스트) 가중 추출 (알리아스 테이블, 추출 O(1))
+    4) 쿨다운 중인 이벤트(event_cooldowns)가 뽑히면 다시 뽑기
+    5) COOLDOWN_REDRAWS번 연속 쿨다운이면 쿨다운이 끝난 후보만 추려 가중 추출
+       (후보 전부가 쿨다운 중일 때만 쿨다운 규칙을 풀고 마지막으로 뽑힌 것 사용)
 
-    # 조건 필터
-    eligible = [e for e in valid_events if _event_matches_conditions(g, e)]
+    events는 EventIndex 권장 (리스트를 넘기면 매번 인덱스를 새로 만든다)
+    """
+    index = _as_event_index(events)
+    eligible = index.eligible_positions(g)
     if not eligible:
         return None
 
-    recent_ids = list(getattr(g, "recent_event_ids", []))
-
-    # 최근 이벤트 제외
-    fresh = [e for e in eligible if e.get("id") not in recent_ids]
-
-    pool = fresh if fresh else eligible
-    chosen = random.choice(pool)
+    table = index.alias_for(eligible, tag_boosts)
+    cooldowns = g.event_cooldowns  # id -> 다시 나올 수 있는 턴
+    turn = g.turn
+    for _ in range(COOLDOWN_REDRAWS):
+        pos = eligible[table.draw(g.rng)]
+        if cooldowns.get(index.events[pos]["id"], 0) <= turn:
+            break
+    else:
+        fresh = [p for p in eligible if cooldowns.get(index.events[p]["id"], 0) <= turn]
+        if fresh:
+            pos = _weighted_pick(g, index, fresh, tag_boosts)
+    chosen = index.events[pos]
 
-    # 최근 기록 업데이트
-    eid = chosen.get("id")
-    if isinstance(eid, str) and eid:
-        recent_ids.append(eid)
-        recent_ids = recent_ids[-recent_limit:]
-        g.recent_event_ids = recent_ids  # type: ignore[attr-defined]
+    # 쿨다운 기록 (만료된 항목은 덮어쓰기로 정리)
+    cooldowns[chosen["id"]] = g.turn + index.cooldowns[pos]
 
     return chosen
 
 
-def maybe_trigger_dialogue_event(g: GameState, dialogue_events: List[Dict[str, Any]], chance: float = 0.35) -> bool:
+def maybe_trigger_dialogue_event(
+    g: GameState,
+    dialogue_events,
+    chance: float = 0.35,
+    tag_boosts: Optional[Dict[str, float]] = None,
+) -> bool:
     if g.pending_event is not None:
         return False
     if not dialogue_events:
         return False
-    if random.random() > chance:
+    if g.rng.random() > chance:
         return False
 
-    picked = _pick_event_with_rules(g, dialogue_events, recent_limit=4)
+    picked = _pick_event_with_rules(g, dialogue_events, tag_boosts)
     if not picked:
         return False
 
@@ -235,17 +325,22 @@ def maybe_trigger_dialogue_event(g: GameState, dialogue_events: List[Dict[str, A
     return True
 
 
-def maybe_trigger_adventure_event(g: GameState, adventure_events: List[Dict[str, Any]], chance: float = 0.20) -> bool:
+def maybe_trigger_adventure_event(
+    g: GameState,
+    adventure_events,
+    chance: float = 0.20,
+    tag_boosts: Optional[Dict[str, float]] = None,
+) -> bool:
     if g.pending_event is not None:
         return False
     if not adventure_events:
         return False
     if g.rank == "인턴":  # 원작 감성 반영: 인턴은 모험 제한
         return False
-    if random.random() > chance:
+    if g.rng.random() > chance:
         return False
 
-    picked = _pick_event_with_rules(g, adventure_events, recent_limit=4)
+    picked = _pick_event_with_rules(g, adventure_events, tag_boosts)
     if not picked:
         return False
 
@@ -285,7 +380,7 @@ def resolve_pending_event_choice(g: GameState, choice_idx: int) -> Optional[str]
 # 승진 / 퇴사 / 판정
 # -------------------------
 def get_total_promotion_rate(g: GameState) -> int:
-    base = BASE_PROMOTION_RATE_BY_RANK.get(g.rank, 10)
+    base = get_rank_table().base_promotion_rate[g.rank_index]
     total = base + g.promotion_rate
     return max(1, min(100, total))
 
@@ -295,6 +390,7 @@ def try_promotion(g: GameState) -> Tuple[bool, Optional[str]]:
     returns:
       (성공여부, 퇴사사유)
     """
+    g.turn += 1
     if g.rank == "CEO":
         push_log(g, "👑 이미 CEO다.")
         return True, None
@@ -304,13 +400,13 @@ def try_promotion(g: GameState) -> Tuple[bool, Optional[str]]:
         return False, None
 
     rate = get_total_promotion_rate(g)
-    roll = random.randint(1, 100)
+    roll = g.rng.randint(1, 100)
 
     push_log(g, f"📈 승진 심사 중... (확률 {rate}%, 주사위 {roll})")
 
     if roll <= rate:
         old_rank = g.rank
-        g.rank_index = min(g.rank_index + 1, len(RANKS) - 1)
+        g.rank_index = min(g.rank_index + 1, get_rank_table().ceo_index)
         g.exp = 0
         g.promotion_fail_count = 0
         g.promotion_rate = max(0, g.promotion_rate - 3)  # 승진 보너스 일부 소모
@@ -351,36 +447,142 @@ def retire_and_rehire(g: GameState, reason: str) -> GameState:
 # -------------------------
 # 엔딩 판정
 # -------------------------
-def check_endings(g: GameState, endings: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+class EndingTable:
     """
-    endings.json 조건과 매칭
-    현재는 간단 조건만 지원:
-      - rank_is
-      - retire_count_gte
-      - company_count_gte
-      - money_gte
+    endings.json 컴파일 결과 (목록 순서 = 판정 우선순위)
+    - 조건 형식 오류 엔딩은 제외하고 errors에 기록
+    - 필드별 기준값 정렬 인덱스: 직전 판정 이후 바뀐 필드가
+      기준값을 넘은 엔딩만 재검사 (check_changed)
     """
-    for e in endings:
-        cond = e.get("conditions", {})
-        ok = True
 
-        rank_is = cond.get("rank_is")
-        if rank_is and g.rank != rank_is:
-            ok = False
+    __slots__ = ("endings", "conditions", "errors", "watch", "_up", "_down", "_eq", "_by_rank")
+
+    def __init__(self, endings: List[Dict[str, Any]]):
+        kept, conds, errors = [], [], []
+        for e in endings or []:
+            try:
+                cond = compile_conditions(e.get("conditions"))
+            except ConditionError as exc:
+                errors.append(f"{e.get('id')}: {exc}")
+                continue
+            kept.append(e)
+            conds.append(cond)
+
+        self.endings = tuple(kept)
+        self.conditions = tuple(conds)
+        self.errors = tuple(errors)
+        self._build_tracker()
+
+    def _build_tracker(self) -> None:
+        """
+        조건 하나가 거짓 -> 참으로 바뀌는 순간을 필드 변화로 잡는다.
+        정수 필드라 gt/lt는 gte/lte로 정규화
+          - _up[f]: 값이 올라가며 넘을 기준값 (gte)
+          - _down[f]: 값이 내려가며 넘을 기준값 (lte)
+          - _eq[f]: 기준값 -> 엔딩
+          - _by_rank: rank_index -> 직급 조건이 있는 엔딩
+        """
+        up: Dict[str, List[Tuple[int, int]]] = {}
+        down: Dict[str, List[Tuple[int, int]]] = {}
+        eq: Dict[str, Dict[int, List[int]]] = {}
+        by_rank: List[List[int]] = [[] for _ in range(len(get_rank_table()))]
+
+        for pos, cond in enumerate(self.conditions):
+            if "rank_index" in cond.fields:
+                for ri in cond.ranks:
+                    by_rank[ri].append(pos)
+            for field_name, op, threshold in cond.checks:
+                if op is operator.ge:
+                    up.setdefault(field_name, []).append((threshold, pos))
+                elif op is operator.gt:
+                    up.setdefault(field_name, []).append((threshold + 1, pos))
+                elif op is operator.le:
+                    down.setdefault(field_name, []).append((threshold, pos))
+                elif op is operator.lt:
+                    down.setdefault(field_name, []).append((threshold - 1, pos))
+                else:
+                    eq.setdefault(field_name, {}).setdefault(threshold, []).append(pos)
+
+        def _split(table):
+            return {
+                f: (tuple(t for t, _ in sorted(items)), tuple(p for _, p in sorted(items)))
+                for f, items in table.items()
+            }
+
+        self._up = _split(up)
+        self._down = _split(down)
+        self._eq = {f: {t: tuple(ps) for t, ps in m.items()} for f, m in eq.items()}
+        self._by_rank = tuple(tuple(b) for b in by_rank)
+        fields = set(self._up) | set(self._down) | set(self._eq)
+        if any(self._by_rank):
+            fields.add("rank_index")
+        self.watch = tuple(sorted(fields))
+
+    def __len__(self) -> int:
+        return len(self.endings)
+
+    def get(self, ending_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        for e in self.endings:
+            if e.get("id") == ending_id:
+                return e
+        return None
 
-        if cond.get("retire_count_gte") is not None:
-            if g.retire_count < int(cond["retire_count_gte"]):
-                ok = False
+    def check(self, g: GameState) -> Optional[Dict[str, Any]]:
+        for e, cond in zip(self.endings, self.conditions):
+            if cond(g):
+                return e
+        return None
+
+    def probe(self, g: GameState) -> Tuple[int, ...]:
+        return tuple(getattr(g, f) for f in self.watch)
+
+    def check_changed(self, g: GameState, prev: Optional[Tuple[int, ...]]) -> Optional[Dict[str, Any]]:
+        """
+        prev(직전 probe 값) 이후 새로 참이 될 수 있는 엔딩만 검사
+        prev가 없으면 전체 검사
+        """
+        if prev is None:
+            return self.check(g)
+
+        candidates = set()
+        for field_name, old, new in zip(self.watch, prev, self.probe(g)):
+            if old == new:
+                continue
+            if field_name == "rank_index":
+                candidates.update(self._by_rank[new])
+            if new > old and field_name in self._up:
+                ts, ps = self._up[field_name]
+                candidates.update(ps[bisect_right(ts, old):bisect_right(ts, new)])
+            if new < old and field_name in self._down:
+                ts, ps = self._down[field_name]
+                candidates.update(ps[bisect_left(ts, new):bisect_left(ts, old)])
+            if field_name in self._eq:
+                candidates.update(self._eq[field_name].get(new, ()))
+
+        for pos in sorted(candidates):
+            if self.conditions[pos](g):
+                return self.endings[pos]
+        return None
 
-        if cond.get("company_count_gte") is not None:
-            if g.company_count < int(cond["company_count_gte"]):
-                ok = False
 
-        if cond.get("money_gte") is not None:
-            if g.money < int(cond["money_gte"]):
-                ok = False
+def check_endings(g: GameState, endings) -> Optional[Dict[str, Any]]:
+    """
+    endings.json 조건과 매칭 (먼저 나온 엔딩 우선)
+    조건 키는 game.conditions 참고
+    endings는 EndingTable 권장 (리스트를 넘기면 매번 컴파일한다)
+    """
+    table = endings if isinstance(endings, EndingTable) else EndingTable(endings)
+    return table.check(g)
 
-        if ok:
-            return e
 
-    return None
+def check_endings_incremental(g: GameState, endings: EndingTable) -> Optional[Dict[str, Any]]:
+    """
+    직전 판정 이후 바뀐 필드에 걸린 엔딩만 재검사
+    - 기준값은 g.ending_probe에 (watch, 값) 으로 보관
+    - 재입사/새 게임으로 상태가 바뀌거나 엔딩 테이블이 바뀌면 전체 검사
+    """
+    prev = g.ending_probe
+    values = prev[1] if prev is not None and prev[0] is endings.watch else None
+    found = endings.check_changed(g, values)
+    g.ending_probe = (endings.watch, endings.probe(g))
+    return found
@@ -0,0 +1,231 @@
+# ceoparkmake/game/odds.py
+
+"""
+승진 / CEO 도달 확률 계산 (동적 계획법, 몬테카를로 교차검증용)
+
+모델: 업무로 경력을 채우고 바로 승진을 시도하는 플레이
+- 승진 확률 q = clamp(기본 + promotion_rate, 1, 100)%
+- 성공: 다음 직급, 실패횟수 0, promotion_rate -3
+- 실패: 실패횟수 +1, 경력 0 -> fail_limit에 닿으면 권고사직
+- 퇴사 후: 인턴, promotion_rate = 10 + min(15, 퇴사횟수)
+이벤트 / 알바 / 번아웃 퇴사는 모델에 없다 (시뮬레이션과 비교할 때 감안).
+
+상태 (직급, 실패횟수, promotion_rate, 퇴사횟수[15에서 포화])는 유한하고
+퇴사 -> 재입사만 순환하므로, 값을 "재입사 시점 기대값 X에 대한 1차식"으로
+메모해 두고 마지막 층(퇴사 15회 이상)에서 X = a + bX를 풀어 닫는다.
+
+예:
+  python -m game.odds --mc 20000
+"""
+
+import argparse
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from .ranks import RankTable, get_rank_table
+from .state import GameState
+
+
+# reset_for_rehire: promotion_rate = 10 + min(15, retire_count)
+REHIRE_BASE_RATE = 10
+RETIRE_BONUS_CAP = 15
+SUCCESS_RATE_COST = 3
+
+
+def _rehire_rate(retire_count: int) -> int:
+    return REHIRE_BASE_RATE + min(RETIRE_BONUS_CAP, retire_count)
+
+
+def _hit_rate(table: RankTable, rank_index: int, promotion_rate: int) -> float:
+    return max(1, min(100, table.base_promotion_rate[rank_index] + promotion_rate)) / 100
+
+
+def _work_turns(required: int, exp_per_work: int) -> int:
+    """경력 required를 채우는 업무 횟수"""
+    if required <= 0:
+        return 0
+    return -(-required // max(1, exp_per_work))
+
+
+@dataclass(frozen=True)
+class PromotionOdds:
+    rate: int  # 이번 승진 시도 확률 (%)
+    next_rank: Optional[float]  # 퇴사 전에 다음 직급 (CEO면 None)
+    resign: float  # 이번 직급에서 권고사직
+    ceo_this_company: float  # 이번 회사에서 퇴사 없이 CEO
+    work_turns_to_attempt: int  # 다음 승진 시도까지 업무 횟수
+    expected_work_turns_to_ceo: float  # CEO까지 기대 업무 횟수 (퇴사/재입사 포함)
+
+
+class _Solver:
+    """
+    (RankTable, 업무 1회 경력) 고정 DP
+    - _affine[c][(r, f, p)] = (a, b): 기대 업무 횟수 = a + b * (퇴사 시 재입사 상태 기대값)
+    - _ceo[(r, f, p)]: 퇴사 없이 CEO까지 갈 확률
+    """
+
+    def __init__(self, table: RankTable, exp_per_work: Tuple[int, ...]):
+        self.table = table
+        self.work = tuple(_work_turns(req, e) for req, e in zip(table.required_exp, exp_per_work))
+        self._affine: Dict[Tuple[int, int, int], Tuple[float, float]] = {}
+        self._ceo: Dict[Tuple[int, int, int], float] = {}
+        self._rehire: Dict[int, float] = {}
+
+    def _affine_at(self, r: int, f: int, p: int) -> Tuple[float, float]:
+        key = (r, f, p)
+        cached = self._affine.get(key)
+        if cached is not None:
+            return cached
+
+        t = self.table
+        if r >= t.ceo_index:
+            result = (0.0, 0.0)
+        else:
+            q = _hit_rate(t, r, p)
+            sa, sb = self._affine_at(r + 1, 0, max(0, p - SUCCESS_RATE_COST))
+            if f + 1 < t.fail_limit[r]:
+                fa, fb = self._affine_at(r, f + 1, p)
+            else:
+                fa, fb = 0.0, 1.0  # 권고사직 -> 재입사 상태
+            result = (self.work[r] + q * sa + (1 - q) * fa, q * sb + (1 - q) * fb)
+
+        self._affine[key] = result
+        return result
+
+    def rehire_value(self, retire_count: int) -> float:
+        """퇴사 retire_count회 직후(인턴 재입사) CEO까지 기대 업무 횟수"""
+        c = min(retire_count, RETIRE_BONUS_CAP)
+        cached = self._rehire.get(c)
+        if cached is not None:
+            return cached
+
+        a, b = self._affine_at(0, 0, _rehire_rate(c))
+        if c == RETIRE_BONUS_CAP:
+            value = a / (1 - b)  # X = a + bX (다음 퇴사도 같은 상태)
+        else:
+            value = a + b * self.rehire_value(c + 1)
+
+        self._rehire[c] = value
+        return value
+
+    def expected(self, r: int, f: int, p: int, retire_count: int) -> float:
+        a, b = self._affine_at(r, f, p)
+        if b == 0.0:
+            return a
+        return a + b * self.rehire_value(retire_count + 1)
+
+    def ceo_without_resign(self, r: int, f: int, p: int) -> float:
+        key = (r, f, p)
+        cached = self._ceo.get(key)
+        if cached is not None:
+            return cached
+
+        t = self.table
+        if r >= t.ceo_index:
+            result = 1.0
+        else:
+            q = _hit_rate(t, r, p)
+            result = q * self.ceo_without_resign(r + 1, 0, max(0, p - SUCCESS_RATE_COST))
+            if f + 1 < t.fail_limit[r]:
+                result += (1 - q) * self.ceo_without_resign(r, f + 1, p)
+
+        self._ceo[key] = result
+        return result
+
+
+@lru_cache(maxsize=16)
+def _solver(table: RankTable, exp_bonus: int) -> _Solver:
+    return _Solver(table, tuple(w.exp + exp_bonus for w in table.work_reward))
+
+
+@lru_cache(maxsize=1024)
+def _odds(
+    table: RankTable,
+    exp_bonus: int,
+    rank_index: int,
+    fail_count: int,
+    promotion_rate: int,
+    retire_count: int,
+    exp: int,
+) -> PromotionOdds:
+    s = _solver(table, exp_bonus)
+    r, f, p = rank_index, fail_count, promotion_rate
+
+    if r >= table.ceo_index:
+        return PromotionOdds(100, None, 0.0, 1.0, 0, 0.0)
+
+    q = _hit_rate(table, r, p)
+    tries_left = max(1, table.fail_limit[r] - f)
+    resign = (1 - q) ** tries_left
+
+    # 첫 시도는 지금 경력에서 출발 (이후 시도는 경력 0부터)
+    first = _work_turns(table.required_exp[r] - exp, table.work_reward[r].exp + exp_bonus)
+    expected = s.expected(r, f, p, retire_count) - s.work[r] + first
+
+    return PromotionOdds(
+        rate=round(q * 100),
+        next_rank=1 - resign,
+        resign=resign,
+        ceo_this_company=s.ceo_without_resign(r, f, p),
+        work_turns_to_attempt=first,
+        expected_work_turns_to_ceo=expected,
+    )
+
+
+def promotion_odds(g: GameState, table: Optional[RankTable] = None) -> PromotionOdds:
+    """현재 GameState 기준 승진 / CEO 확률 (같은 상태는 캐시)"""
+    t = table or get_rank_table()
+    return _odds(
+        t,
+        int(g.upgrade_bonuses.get("work_exp_bonus", 0)),
+        g.rank_index,
+        min(g.promotion_fail_count, t.fail_limit[g.rank_index] - 1),
+        max(0, min(100, g.promotion_rate)),
+        min(g.retire_count, RETIRE_BONUS_CAP),
+        g.exp,
+    )
+
+
+# -------------------------
+# 몬테카를로 교차검증 (같은 모델을 직접 굴려서 비교)
+# -------------------------
+def _mc_work_turns_to_ceo(table: RankTable, rng: random.Random, exp_bonus: int = 0) -> int:
+    r = f = retire_count = 0
+    p = REHIRE_BASE_RATE
+    turns = 0
+    while r < table.ceo_index:
+        turns += _work_turns(table.required_exp[r], table.work_reward[r].exp + exp_bonus)
+        if rng.random() < _hit_rate(table, r, p):
+            r, f, p = r + 1, 0, max(0, p - SUCCESS_RATE_COST)
+        else:
+            f += 1
+            if f >= table.fail_limit[r]:
+                retire_count += 1
+                r, f, p = 0, 0, _rehire_rate(retire_count)
+    return turns
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="ceoparkmake 승진 확률 (DP)")
+    parser.add_argument("--mc", type=int, default=0, help="몬테카를로 교차검증 커리어 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    table = get_rank_table()
+    g = GameState()
+    odds = promotion_odds(g, table)
+    print(f"신입 기준: 다음 직급 {odds.next_rank:.1%} / 권고사직 {odds.resign:.1%} / 첫 회사 CEO {odds.ceo_this_company:.2%}")
+    print(f"CEO까지 기대 업무 횟수 (DP): {odds.expected_work_turns_to_ceo:.1f}")
+
+    if args.mc:
+        rng = random.Random(args.seed)
+        samples = [_mc_work_turns_to_ceo(table, rng) for _ in range(args.mc)]
+        mean = sum(samples) / len(samples)
+        sd = (sum((x - mean) ** 2 for x in samples) / max(1, len(samples) - 1)) ** 0.5
+        print(f"CEO까지 업무 횟수 (MC {args.mc}회): {mean:.1f} ± {1.96 * sd / len(samples) ** 0.5:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+# ceoparkmake/game/optimizer.py
+
+"""
+밸런스 옵티마이저 (목표 지표 -> 제안 ranks.json)
+
+직급별 숫자 전체 대신 몇 개의 손잡이(Knobs)로 현재 RankTable을 변형해서
+game.vsim 벡터 시뮬레이션으로 평가한다.
+- 공통 난수(CRN): 모든 후보를 같은 시드로 평가 -> 후보 간 차이가 잡음에 덜 묻힘
+- 조기 중단(successive halving): 적은 커리어로 전원 평가 -> 상위 절반만 커리어 2배로 재평가
+- 후보 평가는 프로세스 풀로 병렬
+- 라운드마다 최선 후보 주변으로 탐색 폭을 줄여 다시 반복
+- vsim에는 이벤트가 없으므로 최종 후보는 game.sim.run_batch (실제 engine.step)로 다시 평가해
+  엔진 기준 손실로 고르고, vsim과의 차이를 함께 출력
+
+예:
+  python -m game.optimizer --median-turns 2000 --ending ending_survivor=0.2 --out ranks.proposed.json
+"""
+
+import argparse
+import json
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, fields, replace
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .ranks import RankTable, get_rank_table
+from .sim import SimSummary, run_batch
+from .vsim import build_rank_arrays, run_vectorized
+
+
+# -------------------------
+# 목표 지표
+# -------------------------
+@dataclass
+class Targets:
+    median_turns_to_ceo: Optional[float] = None
+    ceo_rate: Optional[float] = None
+    mean_retire_count: Optional[float] = None
+    endings: Dict[str, float] = field(default_factory=dict)  # 엔딩 id -> 비율
+
+    def loss(self, s: SimSummary) -> float:
+        """목표 대비 상대 오차 제곱합 (작을수록 좋음)"""
+        terms = []
+        if self.median_turns_to_ceo is not None:
+            median = s.turns_quantile(0.5)
+            if median is None:
+                return math.inf
+            terms.append(_err(median, self.median_turns_to_ceo, 1.0))
+        if self.ceo_rate is not None:
+            terms.append(_err(s.ceo_rate, self.ceo_rate, 0.05))
+        if self.mean_retire_count is not None:
+            terms.append(_err(s.mean_retire_count, self.mean_retire_count, 0.5))
+        rates = s.ending_rates()
+        for ending_id, share in self.endings.items():
+            terms.append(_err(rates.get(ending_id, 0.0), share, 0.05))
+        return sum(t * t for t in terms)
+
+    def describe(self, s: SimSummary) -> str:
+        rates = s.ending_rates()
+        parts = [
+            f"median={s.turns_quantile(0.5)}",
+            f"ceo={s.ceo_rate:.1%}",
+            f"retire={s.mean_retire_count:.2f}",
+        ]
+        parts += [f"{k}={rates.get(k, 0.0):.1%}" for k in self.endings]
+        return " ".join(parts)
+
+
+def _err(actual: float, target: float, floor: float) -> float:
+    return (actual - target) / max(abs(target), floor)
+
+
+# -------------------------
+# 탐색 손잡이
+# -------------------------
+@dataclass(frozen=True)
+class Knobs:
+    """현재 테이블 대비 변형 (기본값 = 변형 없음)"""
+
+    required_exp_scale: float = 1.0  # 직급별 required_exp 배율 (CEO 제외)
+    work_exp_scale: float = 1.0  # 업무 경력 보상 배율
+    work_money_scale: float = 1.0  # 업무 돈 보상 배율
+    rate_shift: float = 0.0  # 직급별 base_promotion_rate 전체 가감 (%p)
+    rate_slope: float = 0.0  # 직급이 오를수록 추가 가감 (%p / 직급)
+
+    def apply(self, table: RankTable) -> RankTable:
+        """CEO 행(ceo_index)은 종착점이라 그대로 둔다"""
+        n = len(table)
+        ceo = table.ceo_index
+        return replace(
+            table,
+            required_exp=tuple(
+                v if i == ceo or not v else max(1, round(v * self.required_exp_scale))
+                for i, v in enumerate(table.required_exp)
+            ),
+            base_promotion_rate=tuple(
+                v if i == ceo else max(1, min(100, round(v + self.rate_shift + self.rate_slope * (i - (n - 1) / 2))))
+                for i, v in enumerate(table.base_promotion_rate)
+            ),
+            work_reward=tuple(
+                w if i == ceo else w._replace(
+                    exp=max(1, round(w.exp * self.work_exp_scale)),
+                    money=max(0, round(w.money * self.work_money_scale)),
+                )
+                for i, w in enumerate(table.work_reward)
+            ),
+        )
+
+
+# 손잡이별 (하한, 상한, 초기 탐색 폭)
+KNOB_SPACE = {
+    "required_exp_scale": (0.3, 3.0, 0.5),
+    "work_exp_scale": (0.3, 3.0, 0.5),
+    "work_money_scale": (0.2, 5.0, 0.5),
+    "rate_shift": (-40.0, 40.0, 15.0),
+    "rate_slope": (-10.0, 10.0, 4.0),
+}
+
+
+def _perturb(base: Knobs, rng: random.Random, shrink: float) -> Knobs:
+    values = {}
+    for f in fields(Knobs):
+        lo, hi, width = KNOB_SPACE[f.name]
+        v = getattr(base, f.name) + rng.uniform(-1, 1) * width * shrink
+        values[f.name] = round(min(hi, max(lo, v)), 3)
+    return Knobs(**values)
+
+
+# -------------------------
+# 평가 (워커 프로세스)
+# -------------------------
+def _evaluate(args: Tuple[Knobs, RankTable, int, int, int, str]) -> SimSummary:
+    knobs, table, careers, seed, max_steps, policy = args
+    arrays = build_rank_arrays(knobs.apply(table))
+    return run_vectorized(careers, policy, seed=seed, max_steps=max_steps, tables=arrays)
+
+
+@dataclass
+class Trial:
+    knobs: Knobs
+    loss: float  # vsim 기준
+    careers: int
+    summary: SimSummary
+    engine_loss: Optional[float] = None  # run_batch (이벤트 포함) 기준
+    engine_summary: Optional[SimSummary] = None
+
+    @property
+    def final_loss(self) -> float:
+        return self.loss if self.engine_loss is None else self.engine_loss
+
+
+def _engine_rescore(
+    finalists: Sequence[Trial],
+    table: RankTable,
+    targets: Targets,
+    careers: int,
+    seed: int,
+    max_steps: int,
+    policy: str,
+    workers: Optional[int],
+) -> None:
+    """최종 후보를 실제 engine.step 경로(game.sim.run_batch)로 다시 평가 (같은 시드 = CRN)"""
+    for trial in finalists:
+        s = run_batch(careers, policy, seed=seed, max_turns=max_steps, workers=workers, table=trial.knobs.apply(table))
+        trial.engine_summary = s
+        trial.engine_loss = targets.loss(s)
+
+
+def _halving(
+    pool: ProcessPoolExecutor,
+    candidates: Sequence[Knobs],
+    table: RankTable,
+    targets: Targets,
+    careers: int,
+    max_careers: int,
+    seed: int,
+    max_steps: int,
+    policy: str,
+) -> List[Trial]:
+    """successive halving: 전원 소수 평가 -> 상위 절반만 커리어 2배 (모두 같은 시드 = CRN)"""
+    alive = list(candidates)
+    trials: List[Trial] = []
+    n = careers
+    while alive:
+        jobs = [(k, table, n, seed, max_steps, policy) for k in alive]
+        trials = [
+            Trial(k, targets.loss(s), n, s)
+            for k, s in zip(alive, pool.map(_evaluate, jobs))
+        ]
+        trials.sort(key=lambda t: t.loss)
+        if len(trials) <= 2 or n * 2 > max_careers:
+            break
+        alive = [t.knobs for t in trials[: max(2, len(trials) // 2)]]
+        n *= 2
+    return trials
+
+
+def optimize(
+    targets: Targets,
+    table: Optional[RankTable] = None,
+    rounds: int = 4,
+    candidates: int = 16,
+    careers: int = 500,
+    max_careers: int = 8000,
+    seed: int = 0,
+    max_steps: int = 5000,
+    policy: str = "rest",
+    workers: Optional[int] = None,
+    tolerance: float = 1e-3,
+    finalists: int = 3,
+    engine_careers: int = 2000,
+    verbose: bool = False,
+) -> Tuple[RankTable, Trial]:
+    """
+    목표에 가까운 RankTable 탐색
+    - 라운드마다 현재 최선(그대로 포함) 주변 후보 생성 (탐색 폭은 라운드마다 절반)
+    - 손실이 tolerance 아래로 내려가면 조기 종료
+    - vsim 상위 finalists개를 engine_careers회씩 실제 엔진으로 재평가해 그중 최선을 반환
+      (finalists=0이면 vsim 결과만 사용)
+    """
+    table = table or get_rank_table()
+    rng = random.Random(seed)
+    best: Optional[Trial] = None
+    leaders: Dict[Knobs, Trial] = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        center = Knobs()
+        for rnd in range(rounds):
+            shrink = 0.5 ** rnd
+            pool_knobs = [center] + [_perturb(center, rng, shrink) for _ in range(candidates - 1)]
+            trials = _halving(pool, pool_knobs, table, targets, careers, max_careers, seed, max_steps, policy)
+            top = trials[0]
+            for t in trials[:finalists]:
+                if t.knobs not in leaders or t.careers > leaders[t.knobs].careers:
+                    leaders[t.knobs] = t
+
+            if best is None or top.loss < best.loss:
+                best = top
+                center = top.knobs
+            if verbose:
+                print(f"라운드 {rnd + 1}: loss={top.loss:.4f} ({top.careers}회) {targets.describe(top.summary)}")
+                print(f"  {asdict(top.knobs)}")
+            if best.loss < tolerance:
+                break
+
+    if finalists > 0:
+        chosen = sorted(leaders.values(), key=lambda t: t.loss)[:finalists]
+        _engine_rescore(chosen, table, targets, engine_careers, seed, max_steps, policy, workers)
+        best = min(chosen, key=lambda t: t.final_loss)
+        if verbose:
+            print(f"엔진 재평가 ({engine_careers}회, 이벤트 포함):")
+            for t in chosen:
+                print(f"  vsim   loss={t.loss:.4f} {targets.describe(t.summary)}")
+                print(f"  engine loss={t.engine_loss:.4f} {targets.describe(t.engine_summary)}")
+                print(f"  차이 loss={t.engine_loss - t.loss:+.4f} {asdict(t.knobs)}")
+
+    return best.knobs.apply(table), best
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="ceoparkmake 밸런스 옵티마이저")
+    parser.add_argument("--median-turns", type=float, default=None, help="CEO까지 턴 중앙값 목표")
+    parser.add_argument("--ceo-rate", type=float, default=None, help="CEO 도달 비율 목표 (0~1)")
+    parser.add_argument("--retire-count", type=float, default=None, help="평균 퇴사 횟수 목표")
+    parser.add_argument("--ending", action="append", default=[], metavar="ID=SHARE", help="엔딩 비율 목표 (반복 가능)")
+    parser.add_argument("--rounds", type=int, default=4)
+    parser.add_argument("--candidates", type=int, default=16)
+    parser.add_argument("--careers", type=int, default=500, help="첫 평가 커리어 수 (상위 후보만 2배씩)")
+    parser.add_argument("--max-careers", type=int, default=8000)
+    parser.add_argument("--max-steps", type=int, default=5000)
+    parser.add_argument("--policy", choices=["greedy", "rest", "random"], default="rest")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--finalists", type=int, default=3, help="실제 엔진으로 재평가할 최종 후보 수 (0이면 vsim만)")
+    parser.add_argument("--engine-careers", type=int, default=2000, help="엔진 재평가 커리어 수")
+    parser.add_argument("--out", type=Path, default=None, help="제안 ranks.json 경로 (없으면 출력만)")
+    args = parser.parse_args(argv)
+
+    endings = {}
+    for spec in args.ending:
+        ending_id, _, share = spec.partition("=")
+        endings[ending_id] = float(share)
+    targets = Targets(args.median_turns, args.ceo_rate, args.retire_count, endings)
+    if targets == Targets():
+        parser.error("목표 지표를 하나 이상 지정하세요")
+
+    table, best = optimize(
+        targets,
+        rounds=args.rounds,
+        candidates=args.candidates,
+        careers=args.careers,
+        max_careers=args.max_careers,
+        seed=args.seed,
+        max_steps=args.max_steps,
+        policy=args.policy,
+        workers=args.workers,
+        finalists=args.finalists,
+        engine_careers=args.engine_careers,
+        verbose=True,
+    )
+
+    text = json.dumps({"ranks": table.to_ranks()}, ensure_ascii=False, indent=2) + "\n"
+    if args.out:
+        args.out.write_text(text, encoding="utf-8")
+        print(f"제안 ranks.json -> {args.out} (loss={best.final_loss:.4f})")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
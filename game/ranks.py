@@ -0,0 +1,132 @@
+# ceoparkmake/game/ranks.py
+
+"""
+직급 테이블 (data/ranks.json -> rank_index로 바로 찾는 튜플)
+
+핫패스(do_work, 승진 확률, GameState 프로퍼티)는 get_rank_table()로
+현재 테이블을 받아 rank_index로 인덱싱한다.
+콘텐츠가 다시 로드되면 set_rank_table()로 통째로 교체된다.
+
+교체는 감시 스레드에서 일어나므로 행동 1회(engine.step) / rerun 1회 동안은
+pinned_rank_table()로 테이블을 고정해 둔다 (컨텍스트 변수 -> 스레드/세션별).
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class WorkReward(NamedTuple):
+    money: int
+    exp: int
+    hp_cost: int
+    mental_cost: int
+
+
+@dataclass(frozen=True)
+class RankTable:
+    names: Tuple[str, ...]
+    required_exp: Tuple[int, ...]
+    base_promotion_rate: Tuple[int, ...]
+    fail_limit: Tuple[int, ...]
+    work_reward: Tuple[WorkReward, ...]
+
+    @property
+    def ceo_index(self) -> int:
+        """마지막 직급 = 종착점"""
+        return len(self.names) - 1
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_ranks(cls, ranks: List[Dict[str, Any]]) -> "RankTable":
+        """ranks.json의 ranks 리스트 -> RankTable (형식 오류면 ValueError)"""
+        if not ranks:
+            raise ValueError("ranks is empty")
+
+        names, required_exp, base_rate, fail_limit, rewards = [], [], [], [], []
+        for i, r in enumerate(ranks):
+            try:
+                name = r["name"]
+                if not isinstance(name, str) or not name:
+                    raise ValueError("name must be a non-empty string")
+                reward = r["work_reward"]
+                rewards.append(WorkReward(
+                    money=int(reward["money"]),
+                    exp=int(reward["exp"]),
+                    hp_cost=int(reward["hp_cost"]),
+                    mental_cost=int(reward["mental_cost"]),
+                ))
+                required_exp.append(int(r["required_exp"]))
+                base_rate.append(int(r["base_promotion_rate"]))
+                fail_limit.append(int(r["fail_limit"]))
+                names.append(name)
+            except (KeyError, TypeError, ValueError) as exc:
+                raise ValueError(f"ranks[{i}]: {exc}") from None
+
+        if len(set(names)) != len(names):
+            raise ValueError("duplicate rank name")
+
+        return cls(
+            names=tuple(names),
+            required_exp=tuple(required_exp),
+            base_promotion_rate=tuple(base_rate),
+            fail_limit=tuple(fail_limit),
+            work_reward=tuple(rewards),
+        )
+
+    def to_ranks(self) -> List[Dict[str, Any]]:
+        """ranks.json 형식으로 되돌리기"""
+        return [
+            {
+                "name": self.names[i],
+                "required_exp": self.required_exp[i],
+                "base_promotion_rate": self.base_promotion_rate[i],
+                "fail_limit": self.fail_limit[i],
+                "work_reward": self.work_reward[i]._asdict(),
+            }
+            for i in range(len(self.names))
+        ]
+
+
+_active: Optional[RankTable] = None
+_pinned: ContextVar[Optional[RankTable]] = ContextVar("pinned_rank_table", default=None)
+
+
+def get_rank_table() -> RankTable:
+    """고정된 테이블이 있으면 그것, 없으면 현재 전역 테이블"""
+    pinned = _pinned.get()
+    return _active if pinned is None else pinned
+
+
+def get_pinned_rank_table() -> Optional[RankTable]:
+    return _pinned.get()
+
+
+def pin_rank_table(table: Optional[RankTable]) -> None:
+    """현재 컨텍스트의 테이블 고정 (None이면 해제 -> 전역 테이블)"""
+    _pinned.set(table)
+
+
+@contextmanager
+def pinned_rank_table(table: RankTable) -> Iterator[RankTable]:
+    """with 블록 동안 get_rank_table()이 table만 돌려준다 (중첩 가능)"""
+    token = _pinned.set(table)
+    try:
+        yield table
+    finally:
+        _pinned.reset(token)
+
+
+def set_rank_table(table: RankTable) -> None:
+    """
+    현재 테이블 교체
+    직급 이름/개수는 이벤트 인덱스 등과 얽혀 있어서 처음 테이블과 같아야 한다
+    (숫자 밸런스만 재시작 없이 교체)
+    """
+    global _active
+    if _active is not None and table.names != _active.names:
+        raise ValueError("rank names changed; restart required")
+    _active = table
@@ -0,0 +1,53 @@
+# ceoparkmake/game/sampling.py
+
+from typing import List, Sequence
+
+
+class AliasTable:
+    """
+    Walker 알리아스 테이블 (Vose 방식)
+    - 빌드 O(n), 추출 O(1)
+    - 가중치 합이 0이면 균등 추출
+    """
+
+    __slots__ = ("_prob", "_alias")
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        if n == 0:
+            raise ValueError("AliasTable needs at least one weight")
+
+        total = float(sum(weights))
+        if total <= 0:
+            weights = [1.0] * n
+            total = float(n)
+
+        scaled = [w * n / total for w in weights]
+        prob: List[float] = [1.0] * n
+        alias: List[int] = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        # 남은 항목은 부동소수 오차 -> 확률 1
+
+        self._prob = tuple(prob)
+        self._alias = tuple(alias)
+
+    def __len__(self) -> int:
+        return len(self._prob)
+
+    def draw(self, rng) -> int:
+        """rng는 random() 메서드만 있으면 된다 (random 모듈 / random.Random)"""
+        u = rng.random() * len(self._prob)
+        i = int(u)
+        return i if (u - i) < self._prob[i] else self._alias[i]
@@ -0,0 +1,286 @@
+# ceoparkmake/game/serialize.py
+
+"""
+GameState 바이너리 스냅샷 (세션 체크포인트용)
+
+- 정수는 varint(LEB128, 음수는 zigzag)
+- 이벤트/엔딩/업그레이드는 id 문자열 대신 crc32(id) 4바이트로 참조
+  -> 복원 시 콘텐츠 스냅샷에서 다시 찾는다 (핫 리로드로 빠진 이벤트 포함)
+  -> 참조값이 겹치는 id는 콘텐츠 로드 때 errors에 기록하고, 복원 시에는 둘 다 버린다
+- 기본값과 같은 프로필 문자열(이름/회사/…)은 생략
+- 로그/엔딩 판정 기준값(ending_probe)은 저장하지 않는다 (복원 후 새로 시작)
+- RNG 내부 상태 대신 seed + 행동 번호 저장 (RNG는 행동마다 seed/행동 번호로 재시드)
+- 행동 저널은 커리어 길이만큼 자라므로 스냅샷에 넣지 않는다
+  (세션 저장소에 sid별로 append, 스냅샷 크기는 커리어 길이와 무관)
+
+형식 (version 3):
+  u8 version
+  varint x 12  rank_index, hp, hp_max, mental, mental_max, exp, money,
+               promotion_rate, promotion_fail_count, retire_count, company_count, turn
+  varint x 5   업적 (ACHIEVEMENT_KEYS 순서)
+  varint x 2   업무 보너스 (돈, 경력)
+  varint n + u32 x n               구매한 업그레이드
+  u32 (0 = 없음)                   pending 이벤트
+  u32 (0 = 없음)                   발동된 엔딩
+  varint n + (u32, varint) x n     쿨다운 (이벤트, 남은 턴) - 만료된 건 생략
+  u8 flags + (varint len, utf-8) x 프로필 문자열 (flags 비트가 켜진 것만)
+  varint       seed
+  varint       행동 번호 (action_count)
+
+다른 version은 읽지 않는다 (SnapshotError -> 새 게임)
+"""
+
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+from .content import ContentSnapshot, content_ref
+from .state import ACHIEVEMENT_KEYS, Achievements, GameState
+
+FORMAT_VERSION = 3
+
+_INT_FIELDS = (
+    "rank_index",
+    "hp",
+    "hp_max",
+    "mental",
+    "mental_max",
+    "exp",
+    "money",
+    "promotion_rate",
+    "promotion_fail_count",
+    "retire_count",
+    "company_count",
+    "turn",
+)
+_PROFILE_FIELDS = ("name", "company_name", "title", "hometown", "dog_name", "favorite")
+_BONUS_KEYS = ("work_money_bonus", "work_exp_bonus")
+_U32 = struct.Struct("<I")
+
+
+class SnapshotError(ValueError):
+    """스냅샷 형식 오류"""
+
+
+# 콘텐츠 id -> 4바이트 참조값 (0은 '없음'으로 예약, 충돌은 build_snapshot이 errors에 기록)
+ref = content_ref
+
+
+# -------------------------
+# varint
+# -------------------------
+def _put_uvarint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _put_varint(out: bytearray, value: int) -> None:
+    _put_uvarint(out, value << 1 if value >= 0 else ((-value) << 1) - 1)
+
+
+class _Reader:
+    __slots__ = ("buf", "pos")
+
+    def __init__(self, buf: bytes):
+        self.buf = buf
+        self.pos = 0
+
+    def u8(self) -> int:
+        if self.pos >= len(self.buf):
+            raise SnapshotError("truncated snapshot")
+        v = self.buf[self.pos]
+        self.pos += 1
+        return v
+
+    def uvarint(self) -> int:
+        result = shift = 0
+        while True:
+            b = self.u8()
+            result |= (b & 0x7F) << shift
+            if b < 0x80:
+                return result
+            shift += 7
+
+    def varint(self) -> int:
+        v = self.uvarint()
+        return (v >> 1) ^ -(v & 1)
+
+    def u32(self) -> int:
+        if self.pos + 4 > len(self.buf):
+            raise SnapshotError("truncated snapshot")
+        (v,) = _U32.unpack_from(self.buf, self.pos)
+        self.pos += 4
+        return v
+
+    def raw(self) -> bytes:
+        n = self.uvarint()
+        if self.pos + n > len(self.buf):
+            raise SnapshotError("truncated snapshot")
+        v = self.buf[self.pos:self.pos + n]
+        self.pos += n
+        return bytes(v)
+
+    def text(self) -> str:
+        try:
+            return self.raw().decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise SnapshotError("invalid utf-8 in snapshot") from e
+
+
+# -------------------------
+# 콘텐츠 참조 테이블 (스냅샷별 1회)
+# -------------------------
+_ref_tables: Dict[int, Tuple[ContentSnapshot, Dict[int, str], Dict[int, str], Dict[int, str]]] = {}
+
+
+def _ref_table(ids) -> Dict[int, str]:
+    """참조값 -> id (충돌한 참조값은 어느 쪽인지 모르므로 빼 둔다 -> 복원 시 버려짐)"""
+    table: Dict[int, str] = {}
+    ambiguous = set()
+    for cid in ids:
+        r = ref(cid)
+        if table.setdefault(r, cid) != cid:
+            ambiguous.add(r)
+    for r in ambiguous:
+        del table[r]
+    return table
+
+
+def _refs(content: ContentSnapshot) -> Tuple[Dict[int, str], Dict[int, str], Dict[int, str]]:
+    """(이벤트, 엔딩, 업그레이드) 참조값 -> id"""
+    cached = _ref_tables.get(id(content))
+    if cached is not None and cached[0] is content:
+        return cached[1:]
+
+    events = _ref_table(content.events_by_id)
+    endings = _ref_table(e["id"] for e in content.endings.endings if isinstance(e.get("id"), str))
+    upgrades = _ref_table(row.id for row in content.upgrade_catalog.rows if row.id)
+    if len(_ref_tables) >= 4:
+        _ref_tables.clear()
+    _ref_tables[id(content)] = (content, events, endings, upgrades)
+    return events, endings, upgrades
+
+
+# -------------------------
+# dumps / loads
+# -------------------------
+def dumps_state(g: GameState) -> bytes:
+    out = bytearray((FORMAT_VERSION,))
+
+    for name in _INT_FIELDS:
+        _put_varint(out, getattr(g, name))
+    for v in g.achievements.values():
+        _put_uvarint(out, v)
+    for key in _BONUS_KEYS:
+        _put_varint(out, g.upgrade_bonuses.get(key, 0))
+
+    _put_uvarint(out, len(g.purchased_upgrades))
+    for uid in sorted(g.purchased_upgrades):
+        out += _U32.pack(ref(uid))
+
+    pending_id = g.pending_event.get("id") if g.pending_event else None
+    out += _U32.pack(ref(pending_id) if pending_id else 0)
+    out += _U32.pack(ref(g.triggered_ending_id) if g.triggered_ending_id else 0)
+
+    active = [(eid, until - g.turn) for eid, until in g.event_cooldowns.items() if until > g.turn]
+    _put_uvarint(out, len(active))
+    for eid, remaining in active:
+        out += _U32.pack(ref(eid))
+        _put_uvarint(out, remaining)
+
+    defaults = GameState.__dataclass_fields__
+    flags = 0
+    texts: List[str] = []
+    for bit, name in enumerate(_PROFILE_FIELDS):
+        value = getattr(g, name)
+        if value != defaults[name].default:
+            flags |= 1 << bit
+            texts.append(value)
+    out.append(flags)
+    for value in texts:
+        raw = value.encode("utf-8")
+        _put_uvarint(out, len(raw))
+        out += raw
+
+    _put_uvarint(out, g.seed)
+    _put_uvarint(out, g.action_count)
+
+    return bytes(out)
+
+
+def _resolve(table: Dict[int, str], value: int) -> Optional[str]:
+    return table.get(value) if value else None
+
+
+_ACHIEVEMENT_MAX = 0xFFFFFFFF  # Achievements는 array("I")
+
+
+def _check_ranges(kwargs: Dict[str, Any], content: ContentSnapshot) -> None:
+    """값 범위 검사 (깨진 스냅샷이 복원된 뒤 g.rank 등에서 터지지 않게)"""
+    if not 0 <= kwargs["rank_index"] < len(content.rank_table):
+        raise SnapshotError(f"rank_index out of range: {kwargs['rank_index']}")
+    if not 0 <= kwargs["hp"] <= kwargs["hp_max"]:
+        raise SnapshotError("hp out of range")
+    if not 0 <= kwargs["mental"] <= kwargs["mental_max"]:
+        raise SnapshotError("mental out of range")
+    if not 0 <= kwargs["promotion_rate"] <= 100:
+        raise SnapshotError("promotion_rate out of range")
+    for name in ("exp", "money", "promotion_fail_count", "retire_count", "turn"):
+        if kwargs[name] < 0:
+            raise SnapshotError(f"{name} out of range")
+    if kwargs["company_count"] < 1:
+        raise SnapshotError("company_count out of range")
+    if any(v > _ACHIEVEMENT_MAX for v in kwargs["achievements"]):
+        raise SnapshotError("achievement count out of range")
+
+
+def loads_state(data: bytes, content: ContentSnapshot) -> GameState:
+    """
+    스냅샷 -> GameState
+    콘텐츠에서 사라진 이벤트/엔딩/업그레이드 참조는 버린다
+    형식이 깨졌거나 값이 범위를 벗어나면 SnapshotError (그 외 예외는 내지 않는다)
+    """
+    r = _Reader(data)
+    version = r.u8()
+    if version != FORMAT_VERSION:
+        raise SnapshotError(f"unsupported snapshot version {version}")
+
+    events, endings, upgrades = _refs(content)
+
+    kwargs: Dict[str, Any] = {name: r.varint() for name in _INT_FIELDS}
+    kwargs["achievements"] = [r.uvarint() for _ in ACHIEVEMENT_KEYS]
+    kwargs["upgrade_bonuses"] = {key: r.varint() for key in _BONUS_KEYS}
+
+    purchased = (_resolve(upgrades, r.u32()) for _ in range(r.uvarint()))
+    kwargs["purchased_upgrades"] = {uid for uid in purchased if uid}
+
+    pending_id = _resolve(events, r.u32())
+    kwargs["pending_event"] = content.event(pending_id) if pending_id else None
+    kwargs["triggered_ending_id"] = _resolve(endings, r.u32())
+
+    turn = kwargs["turn"]
+    cooldowns = {}
+    for _ in range(r.uvarint()):
+        eid = _resolve(events, r.u32())
+        remaining = r.uvarint()
+        if eid:
+            cooldowns[eid] = turn + remaining
+    kwargs["event_cooldowns"] = cooldowns
+
+    flags = r.u8()
+    for bit, name in enumerate(_PROFILE_FIELDS):
+        if flags & (1 << bit):
+            kwargs[name] = r.text()
+
+    kwargs["seed"] = r.uvarint()
+    kwargs["action_count"] = r.uvarint()
+
+    if r.pos != len(data):
+        raise SnapshotError("trailing bytes in snapshot")
+    _check_ranges(kwargs, content)
+    counts = kwargs["achievements"]
+    kwargs["achievements"] = Achievements()
+    for key, v in zip(ACHIEVEMENT_KEYS, counts):
+        kwargs["achievements"][key] = v
+    return GameState(**kwargs)
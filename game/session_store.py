@@ -0,0 +1,294 @@
+# ceoparkmake/game/session_store.py
+
+"""
+세션 저장소 (Streamlit 재접속 / 워커 재시작 후에도 진행 유지)
+
+- 값은 game.serialize 스냅샷 bytes, 키는 세션 id(sid)
+- 행동 저널은 sid별 append 전용 기록으로 따로 (스냅샷은 고정 크기 유지)
+- SQLiteSessionStore: WAL 모드 + 백그라운드 write-behind
+  put()은 메모리 대기열에 넣고 바로 반환 (클릭마다 rerun을 막지 않음)
+  같은 세션의 여러 액션은 마지막 값 하나로 합쳐서, 타이머마다 한 트랜잭션으로 커밋
+- LRUSessionStore: 최근 세션을 메모리에 두는 앞단 (읽기는 대부분 여기서 끝남)
+- open_session_store(): 프로세스 전역 저장소 (경로는 CEOPARK_SESSION_DB, 기본 data/sessions.sqlite3)
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from .content_loader import DATA_DIR
+
+
+DEFAULT_DB_PATH = DATA_DIR / "sessions.sqlite3"
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_LRU_CAPACITY = 256
+
+
+class SessionStore(ABC):
+    """
+    저장소 인터페이스
+    - 스냅샷: sid당 최신 값 하나 (덮어쓰기)
+    - 행동 저널: sid별 append 전용 (스냅샷 크기가 커리어 길이에 따라 커지지 않게 따로 둔다)
+    """
+
+    @abstractmethod
+    def get(self, sid: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def put(self, sid: str, data: bytes) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, sid: str) -> None:
+        """스냅샷과 저널 모두 삭제"""
+
+    @abstractmethod
+    def append_journal(self, sid: str, data: bytes) -> None:
+        ...
+
+    @abstractmethod
+    def get_journal(self, sid: str) -> bytes:
+        """지금까지 append된 저널 전체 (없으면 b"")"""
+
+    def flush(self) -> None:
+        """대기 중인 쓰기를 지금 반영"""
+
+    def close(self) -> None:
+        self.flush()
+
+
+# -------------------------
+# SQLite (write-behind)
+# -------------------------
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    sid TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS journal (
+    sid TEXT NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS journal_sid ON journal (sid);
+"""
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    로컬 SQLite 파일 하나로 동작
+    - _pending: sid -> 최신 bytes (None = 삭제 예정)
+    - _pending_journal: sid -> 아직 안 쓴 저널 조각 (이어 붙임)
+    - _journal_resets: 저널을 지울 sid (delete 이후 새 조각보다 먼저 반영)
+    - 쓰기 스레드가 flush_interval마다 대기분을 통째로 가져가 한 트랜잭션으로 커밋
+      (스냅샷과 그 사이 저널 조각이 같이 반영된다)
+    - 가져간 스냅샷 배치는 커밋이 끝날 때까지 _inflight로 get()에 계속 보인다
+      (그 사이 읽으면 예전 행이 나오는 틈 방지, flush는 한 번에 하나만)
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.last_error: Optional[str] = None
+
+        self._db_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[str, Optional[bytes]] = {}
+        self._pending_journal: Dict[str, bytearray] = {}
+        self._journal_resets: Set[str] = set()
+        self._inflight: Dict[str, Optional[bytes]] = {}
+        self._stop_event = threading.Event()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        self._thread = threading.Thread(target=self._run, name="session-writer", daemon=True)
+        self._thread.start()
+
+    def get(self, sid: str) -> Optional[bytes]:
+        with self._pending_lock:
+            if sid in self._pending:
+                return self._pending[sid]
+            if sid in self._inflight:
+                return self._inflight[sid]
+        with self._db_lock:
+            row = self._conn.execute("SELECT data FROM sessions WHERE sid = ?", (sid,)).fetchone()
+        return bytes(row[0]) if row else None
+
+    def put(self, sid: str, data: bytes) -> None:
+        with self._pending_lock:
+            self._pending[sid] = data
+
+    def delete(self, sid: str) -> None:
+        with self._pending_lock:
+            self._pending[sid] = None
+            self._pending_journal.pop(sid, None)
+            self._journal_resets.add(sid)
+
+    def append_journal(self, sid: str, data: bytes) -> None:
+        if not data:
+            return
+        with self._pending_lock:
+            self._pending_journal.setdefault(sid, bytearray()).extend(data)
+
+    def get_journal(self, sid: str) -> bytes:
+        # flush 중이 아닐 때만 읽는다 -> DB + 대기분 사이에 빠지거나 겹치는 조각 없음
+        with self._flush_lock:
+            with self._pending_lock:
+                reset = sid in self._journal_resets
+                tail = bytes(self._pending_journal.get(sid, b""))
+            if reset:
+                return tail
+            with self._db_lock:
+                rows = self._conn.execute(
+                    "SELECT data FROM journal WHERE sid = ? ORDER BY rowid", (sid,)
+                ).fetchall()
+        return b"".join(bytes(row[0]) for row in rows) + tail
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, {}
+                journal, self._pending_journal = self._pending_journal, {}
+                resets, self._journal_resets = self._journal_resets, set()
+                self._inflight = batch
+            if not (batch or journal or resets):
+                return
+            try:
+                self._write(batch, journal, resets)
+            except sqlite3.Error:
+                # 실패한 배치는 되돌려 놓고 다음 주기에 재시도 (그 사이 들어온 새 값이 우선)
+                with self._pending_lock:
+                    self._pending = {**batch, **self._pending}
+                    for sid, chunk in journal.items():
+                        if sid not in self._journal_resets:  # 그 사이 삭제됐으면 버림
+                            self._pending_journal[sid] = chunk + self._pending_journal.get(sid, b"")
+                    self._journal_resets |= resets
+                    self._inflight = {}
+                raise
+            with self._pending_lock:
+                self._inflight = {}
+
+    def _write(
+        self,
+        batch: Dict[str, Optional[bytes]],
+        journal: Dict[str, bytearray],
+        resets: Set[str],
+    ) -> None:
+        now = time.time()
+        upserts = [(sid, data, now) for sid, data in batch.items() if data is not None]
+        deletes = [(sid,) for sid, data in batch.items() if data is None]
+        with self._db_lock, self._conn:
+            if resets:
+                self._conn.executemany("DELETE FROM journal WHERE sid = ?", [(sid,) for sid in resets])
+            if deletes:
+                self._conn.executemany("DELETE FROM sessions WHERE sid = ?", deletes)
+            if upserts:
+                self._conn.executemany(
+                    "INSERT INTO sessions (sid, data, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(sid) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                    upserts,
+                )
+            if journal:
+                self._conn.executemany(
+                    "INSERT INTO journal (sid, data) VALUES (?, ?)",
+                    [(sid, bytes(chunk)) for sid, chunk in journal.items()],
+                )
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as exc:  # 쓰기 스레드는 죽지 않게
+                self.last_error = repr(exc)
+
+    def close(self) -> None:
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self.flush()
+        with self._db_lock:
+            self._conn.close()
+
+
+# -------------------------
+# 메모리 LRU 앞단
+# -------------------------
+class LRUSessionStore(SessionStore):
+    """최근 capacity개 세션은 메모리에서 바로 반환, 쓰기는 뒤 저장소로 그대로 전달"""
+
+    def __init__(self, backend: SessionStore, capacity: int = DEFAULT_LRU_CAPACITY):
+        self.backend = backend
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def _remember(self, sid: str, data: bytes) -> None:
+        with self._lock:
+            self._items[sid] = data
+            self._items.move_to_end(sid)
+            while len(self._items) > self.capacity:
+                self._items.popitem(last=False)
+
+    def get(self, sid: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._items.get(sid)
+            if data is not None:
+                self._items.move_to_end(sid)
+                return data
+        data = self.backend.get(sid)
+        if data is not None:
+            self._remember(sid, data)
+        return data
+
+    def put(self, sid: str, data: bytes) -> None:
+        self._remember(sid, data)
+        self.backend.put(sid, data)
+
+    def delete(self, sid: str) -> None:
+        with self._lock:
+            self._items.pop(sid, None)
+        self.backend.delete(sid)
+
+    def append_journal(self, sid: str, data: bytes) -> None:
+        self.backend.append_journal(sid, data)
+
+    def get_journal(self, sid: str) -> bytes:
+        return self.backend.get_journal(sid)
+
+    def flush(self) -> None:
+        self.backend.flush()
+
+    def close(self) -> None:
+        self.backend.close()
+
+
+# -------------------------
+# 프로세스 전역 저장소
+# -------------------------
+_store_lock = threading.Lock()
+_store: Optional[SessionStore] = None
+
+
+def open_session_store() -> SessionStore:
+    """프로세스당 1개 (종료 시 남은 쓰기 flush)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            path = os.environ.get("CEOPARK_SESSION_DB") or DEFAULT_DB_PATH
+            _store = LRUSessionStore(SQLiteSessionStore(path))
+            atexit.register(_store.close)
+        return _store
@@ -0,0 +1,253 @@
+# ceoparkmake/game/sim.py
+
+"""
+헤드리스 시뮬레이션 (Streamlit 없이 커리어 N회 자동 플레이)
+턴 진행은 game.engine.step (app.py와 같은 파이프라인)
+
+예:
+  python -m game.sim -n 100000 --policy rest --workers 8
+"""
+
+import argparse
+import dataclasses
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .content import ContentSnapshot, get_content
+from .engine import Action, choice, step
+from .ranks import RankTable, pinned_rank_table
+from .state import ACTION_CODES, GameState, action_seed, init_game_state
+
+
+# -------------------------
+# 정책 (상태 -> 행동)
+# -------------------------
+# 행동: "work" / "rest" / "part_time" / "promote"
+Policy = Callable[[GameState, random.Random], str]
+
+
+def policy_greedy_work(g: GameState, rng: random.Random) -> str:
+    """쉬지 않고 일만 하고, 경력이 차면 바로 승진 시도"""
+    if g.can_try_promotion:
+        return "promote"
+    return "work"
+
+
+def policy_rest_threshold(g: GameState, rng: random.Random, hp_min: int = 30, mental_min: int = 30) -> str:
+    """체력/멘탈이 기준 아래면 휴식, 아니면 greedy"""
+    if g.hp < hp_min or g.mental < mental_min:
+        return "rest"
+    return policy_greedy_work(g, rng)
+
+
+def policy_random(g: GameState, rng: random.Random) -> str:
+    """무작위 행동 (승진은 가능할 때만)"""
+    actions = ["work", "rest", "part_time"]
+    if g.can_try_promotion:
+        actions.append("promote")
+    return rng.choice(actions)
+
+
+# 프로세스 풀로 넘길 수 있게 이름으로 지정
+POLICIES: Dict[str, Policy] = {
+    "greedy": policy_greedy_work,
+    "rest": policy_rest_threshold,
+    "random": policy_random,
+}
+
+
+# -------------------------
+# 커리어 1회 / 배치
+# -------------------------
+@dataclass
+class CareerResult:
+    turns: int
+    reached_ceo: bool
+    retire_count: int
+    ending_id: Optional[str]
+
+
+def play_career(
+    seed: int,
+    policy: str = "greedy",
+    content: Optional[ContentSnapshot] = None,
+    max_turns: int = 5000,
+) -> CareerResult:
+    """
+    시드 고정 커리어 1회
+    - CEO 도달 또는 max_turns에서 종료
+    - 엔딩은 app.py처럼 최초 1회만 기록
+    """
+    if content is None:
+        content = get_content()
+
+    # 게임 RNG는 GameState가 시드로 직접 소유 (전역 random 미사용)
+    # 배치 시뮬은 (seed, policy)로 재현되므로 저널/행동별 재시드 없이 한 스트림으로 진행
+    policy_rng = random.Random(seed ^ 0x5EED)
+    choose = POLICIES[policy]
+    actions = {name: Action(code) for name, code in ACTION_CODES.items()}
+
+    g = init_game_state(seed)
+    game_rng = random.Random(action_seed(g.seed, 0))
+    turns = 0
+
+    # 직급 테이블은 커리어 전체에서 한 번만 고정 (step마다 고정/해제하지 않게)
+    with pinned_rank_table(content.rank_table):
+        while turns < max_turns and g.rank != "CEO":
+            turns += 1
+
+            if g.pending_event is not None:
+                choices = g.pending_event.get("choices", [])
+                g, _ = step(g, choice(policy_rng.randrange(len(choices))), content, game_rng)
+            else:
+                g, _ = step(g, actions[choose(g, policy_rng)], content, game_rng)
+
+    return CareerResult(
+        turns=turns,
+        reached_ceo=g.rank == "CEO",
+        retire_count=g.retire_count,
+        ending_id=g.triggered_ending_id,
+    )
+
+
+@dataclass
+class SimSummary:
+    careers: int = 0
+    ceo_count: int = 0
+    turns_to_ceo: Counter = field(default_factory=Counter)  # 턴 수 -> 커리어 수
+    retire_counts: Counter = field(default_factory=Counter)  # 퇴사 횟수 -> 커리어 수
+    endings: Counter = field(default_factory=Counter)  # 엔딩 id -> 커리어 수
+
+    def add(self, r: CareerResult) -> None:
+        self.careers += 1
+        if r.reached_ceo:
+            self.ceo_count += 1
+            self.turns_to_ceo[r.turns] += 1
+        self.retire_counts[r.retire_count] += 1
+        self.endings[r.ending_id or "none"] += 1
+
+    def merge(self, other: "SimSummary") -> None:
+        self.careers += other.careers
+        self.ceo_count += other.ceo_count
+        self.turns_to_ceo.update(other.turns_to_ceo)
+        self.retire_counts.update(other.retire_counts)
+        self.endings.update(other.endings)
+
+    # --- 집계 ---
+    def turns_quantile(self, q: float) -> Optional[int]:
+        if not self.turns_to_ceo:
+            return None
+        target = q * (self.ceo_count - 1)
+        seen = 0
+        for turns in sorted(self.turns_to_ceo):
+            seen += self.turns_to_ceo[turns]
+            if seen > target:
+                return turns
+        return max(self.turns_to_ceo)
+
+    @property
+    def ceo_rate(self) -> float:
+        return self.ceo_count / self.careers if self.careers else 0.0
+
+    @property
+    def mean_retire_count(self) -> float:
+        if not self.careers:
+            return 0.0
+        return sum(k * v for k, v in self.retire_counts.items()) / self.careers
+
+    def ending_rates(self) -> Dict[str, float]:
+        return {k: v / self.careers for k, v in self.endings.most_common()}
+
+    def report(self) -> str:
+        lines = [
+            f"커리어 {self.careers}회 / CEO 도달 {self.ceo_count}회 ({self.ceo_rate:.1%})",
+            f"CEO까지 턴: p10={self.turns_quantile(0.1)} / 중앙값={self.turns_quantile(0.5)} / p90={self.turns_quantile(0.9)}",
+            f"평균 퇴사 횟수: {self.mean_retire_count:.2f}",
+        ]
+        for ending_id, rate in self.ending_rates().items():
+            lines.append(f"  엔딩 {ending_id}: {rate:.1%}")
+        return "\n".join(lines)
+
+
+# 워커 프로세스별 콘텐츠 (initializer에서 1회 로드)
+_WORKER_CONTENT: Optional[ContentSnapshot] = None
+
+
+def _init_worker() -> None:
+    global _WORKER_CONTENT
+    _WORKER_CONTENT = get_content()
+
+
+def _run_chunk(args: Tuple[int, int, str, int, Optional[RankTable]]) -> SimSummary:
+    first_seed, count, policy, max_turns, table = args
+    content = _WORKER_CONTENT or get_content()
+    if table is not None:
+        content = dataclasses.replace(content, rank_table=table)
+    summary = SimSummary()
+    for seed in range(first_seed, first_seed + count):
+        summary.add(play_career(seed, policy, content, max_turns))
+    return summary
+
+
+def run_batch(
+    n: int,
+    policy: str = "greedy",
+    seed: int = 0,
+    max_turns: int = 5000,
+    workers: Optional[int] = None,
+    chunk_size: int = 500,
+    table: Optional[RankTable] = None,
+) -> SimSummary:
+    """
+    커리어 n회를 프로세스 풀로 나눠 실행
+    - 커리어 i의 시드는 seed + i (워커 수와 무관하게 재현 가능)
+    - workers=1이면 현재 프로세스에서 실행
+    - table: 현재 콘텐츠 대신 쓸 RankTable (밸런스 후보 평가용)
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"unknown policy: {policy}")
+
+    chunks = [
+        (seed + start, min(chunk_size, n - start), policy, max_turns, table)
+        for start in range(0, n, chunk_size)
+    ]
+
+    total = SimSummary()
+    if workers == 1:
+        _init_worker()
+        for chunk in chunks:
+            total.merge(_run_chunk(chunk))
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        for part in pool.map(_run_chunk, chunks):
+            total.merge(part)
+    return total
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="ceoparkmake 헤드리스 시뮬레이션")
+    parser.add_argument("-n", "--careers", type=int, default=10000)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    summary = run_batch(
+        args.careers,
+        policy=args.policy,
+        seed=args.seed,
+        max_turns=args.max_turns,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+    print(summary.report())
+
+
+if __name__ == "__main__":
+    main()
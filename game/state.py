@@ -1,17 +1,189 @@
 # ceoparkmake/game/state.py
 
-from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
+import random
+import secrets
+import threading
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator, List, Set, Tuple, Union
 
-from .balance import (
-    RANKS,
-    EXP_REQUIREMENT_BY_RANK,
-    PROMOTION_FAIL_LIMIT,
-    DEFAULT_FAIL_LIMIT,
-)
+from .ranks import get_rank_table
+from . import balance  # 임포트 시 ranks.json -> 현재 RankTable 설정
 
 
-@dataclass
+DEFAULT_LOG_CAPACITY = 12
+
+
+class GameLog:
+    """
+    최근 로그 고정 크기 링버퍼
+    - 최신 로그가 앞 (순회 시 복사 없이 최신순)
+    - history_path를 주면 전체 기록을 파일에 계속 append
+    - seq: 지금까지 push된 개수 (최신 로그 번호), epoch: 로그 객체마다 새 값
+      -> UI는 (epoch, seq)만 기억해 두고 새로 붙은 로그만 보낸다 (since)
+    """
+
+    __slots__ = ("_items", "history_path", "seq", "epoch")
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_LOG_CAPACITY,
+        history_path: Optional[Union[str, Path]] = None,
+    ):
+        self._items = deque(maxlen=capacity)
+        self.history_path = history_path
+        self.seq = 0
+        self.epoch = secrets.randbits(31)
+
+    @property
+    def capacity(self) -> int:
+        return self._items.maxlen
+
+    def push(self, msg: str) -> None:
+        self._items.appendleft(msg)
+        self.seq += 1
+        if self.history_path is not None:
+            with open(self.history_path, "a", encoding="utf-8") as f:
+                f.write(msg + "\n")
+
+    def since(self, seq: int) -> List[Tuple[int, str]]:
+        """seq 이후에 붙은 로그 [(번호, 메시지)] 오래된 순 (버퍼에 남아 있는 것만)"""
+        n = min(self.seq - seq, len(self._items))
+        return [(self.seq - i, self._items[i]) for i in range(n - 1, -1, -1)]
+
+    def new_career(self) -> "GameLog":
+        """재입사용 빈 로그 (용량/기록 파일 유지)"""
+        return GameLog(self.capacity, self.history_path)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, idx: int) -> str:
+        return self._items[idx]
+
+
+# 업적 키 -> 고정 인덱스
+ACHIEVEMENT_KEYS = ("퇴사사유_수집", "직관러", "두붕맘", "데이터장인", "악마팀장")
+_ACHIEVEMENT_INDEX = {k: i for i, k in enumerate(ACHIEVEMENT_KEYS)}
+
+
+class Achievements:
+    """
+    업적 카운트 (ACHIEVEMENT_KEYS 순서의 고정 int 배열)
+    - 기존 dict 사용법(g.achievements["두붕맘"], .get, .items, .copy) 그대로 지원
+    """
+
+    __slots__ = ("_counts",)
+
+    def __init__(self, counts: Optional[array] = None):
+        self._counts = counts if counts is not None else array("I", bytes(4 * len(ACHIEVEMENT_KEYS)))
+
+    def __getitem__(self, key: str) -> int:
+        return self._counts[_ACHIEVEMENT_INDEX[key]]
+
+    def __setitem__(self, key: str, value: int) -> None:
+        self._counts[_ACHIEVEMENT_INDEX[key]] = value
+
+    def get(self, key: str, default: int = 0) -> int:
+        idx = _ACHIEVEMENT_INDEX.get(key)
+        return default if idx is None else self._counts[idx]
+
+    def keys(self) -> Tuple[str, ...]:
+        return ACHIEVEMENT_KEYS
+
+    def values(self) -> List[int]:
+        return self._counts.tolist()
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        return zip(ACHIEVEMENT_KEYS, self._counts)
+
+    def copy(self) -> "Achievements":
+        return Achievements(array("I", self._counts))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(ACHIEVEMENT_KEYS)
+
+    def __len__(self) -> int:
+        return len(ACHIEVEMENT_KEYS)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Achievements):
+            return self._counts == other._counts
+        return dict(self.items()) == other
+
+    def __repr__(self) -> str:
+        return f"Achievements({dict(self.items())})"
+
+
+# 행동 저널 코드 (저널 1항목 = 코드 1바이트 + 인자 uvarint)
+ACTION_WORK = 1
+ACTION_REST = 2
+ACTION_PART_TIME = 3
+ACTION_PROMOTE = 4
+ACTION_CHOICE = 5  # 인자: 선택지 번호
+ACTION_UPGRADE = 6  # 인자: 업그레이드 번호 (콘텐츠 카테고리 순서로 펼친 목록 기준)
+
+ACTION_CODES = {
+    "work": ACTION_WORK,
+    "rest": ACTION_REST,
+    "part_time": ACTION_PART_TIME,
+    "promote": ACTION_PROMOTE,
+}
+
+
+def action_seed(seed: int, action_no: int) -> int:
+    """세션 시드 + 행동 번호 -> 그 행동의 RNG 시드"""
+    return (seed << 32) + action_no
+
+
+def encode_action(code: int, arg: int = 0) -> bytes:
+    """저널 1항목 (인자는 0 이상 아무 크기나)"""
+    if not 0 < code < 0x80 or arg < 0:
+        raise ValueError(f"invalid action ({code}, {arg})")
+    out = bytearray((code,))
+    while arg >= 0x80:
+        out.append((arg & 0x7F) | 0x80)
+        arg >>= 7
+    out.append(arg)
+    return bytes(out)
+
+
+def iter_journal(journal: bytes) -> Iterator[Tuple[int, int]]:
+    """저널 -> (코드, 인자) 순서대로"""
+    pos, n = 0, len(journal)
+    while pos < n:
+        code = journal[pos]
+        arg = shift = 0
+        while True:
+            pos += 1
+            if pos >= n:
+                raise ValueError("truncated journal")
+            b = journal[pos]
+            arg |= (b & 0x7F) << shift
+            if b < 0x80:
+                break
+            shift += 7
+        pos += 1
+        yield code, arg
+
+
+# 저널 기록 행동용 RNG: 행동마다 재시드하므로 상태마다 따로 둘 필요 없이 스레드당 1개
+_thread_rng = threading.local()
+
+
+def _action_rng() -> random.Random:
+    rng = getattr(_thread_rng, "rng", None)
+    if rng is None:
+        rng = _thread_rng.rng = random.Random()
+    return rng
+
+
+@dataclass(slots=True)
 class GameState:
     # 기본 정보
     name: str = "박효진"
@@ -31,6 +203,7 @@ class GameState:
     promotion_rate: int = 10  # 추가 보너스 개념
     promotion_fail_count: int = 0
     retire_count: int = 0
+    turn: int = 0  # 누적 행동 횟수 (재입사해도 유지)
 
     # 캐릭터 설정
     title: str = "통계 석사"
@@ -39,38 +212,52 @@ class GameState:
     favorite: str = "야구 직관"
 
     # 런타임
-    game_log: Optional[List[str]] = None
+    game_log: Optional[GameLog] = None
     pending_event: Optional[Dict[str, Any]] = None
-    achievements: Optional[Dict[str, int]] = None
+    achievements: Optional[Achievements] = None
+    event_cooldowns: Dict[str, int] = field(default_factory=dict)  # 이벤트 id -> 다시 나올 수 있는 턴
+    ending_probe: Optional[tuple] = None  # 직전 엔딩 판정 시 필드 값 (check_endings_incremental)
+
+    # 업그레이드 / 엔딩 (재입사해도 유지)
+    purchased_upgrades: Set[str] = field(default_factory=set)
+    upgrade_bonuses: Dict[str, int] = field(default_factory=lambda: {"work_money_bonus": 0, "work_exp_bonus": 0})
+    # (RankTable, 직급별 실제 업무 보상) - upgrade_bonuses에서 파생, 저장하지 않음 (game.upgrades.work_reward)
+    work_reward_cache: Optional[tuple] = field(default=None, repr=False, compare=False)
+    triggered_ending_id: Optional[str] = None
+
+    # 재현용 RNG / 행동 저널 (재입사해도 유지)
+    # - 행동마다 action_seed(seed, action_count)로 재시드 -> seed + 저널만으로 그대로 재생
+    # - rng는 begin_action이 스레드 공용 RNG를 재시드해서 꽂아 준다 (배치 시뮬은 직접 지정)
+    # - 세션 스냅샷에는 seed / action_count만, 저널은 세션 저장소에 따로 append
+    #   (앱은 저장할 때마다 여기 쌓인 부분을 넘기고 비운다)
+    seed: int = 0
+    action_count: int = 0
+    journal: bytearray = field(default_factory=bytearray)
+    rng: Optional[random.Random] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         if self.game_log is None:
-            self.game_log = []
+            self.game_log = GameLog()
 
         if self.achievements is None:
-            self.achievements = {
-                "퇴사사유_수집": 0,
-                "직관러": 0,
-                "두붕맘": 0,
-                "데이터장인": 0,
-                "악마팀장": 0,
-            }
+            self.achievements = Achievements()
 
     @property
     def rank(self) -> str:
-        return RANKS[self.rank_index]
+        return get_rank_table().names[self.rank_index]
 
     @property
     def required_exp(self) -> int:
-        return EXP_REQUIREMENT_BY_RANK[self.rank]
+        return get_rank_table().required_exp[self.rank_index]
 
     @property
     def fail_limit(self) -> int:
-        return PROMOTION_FAIL_LIMIT.get(self.rank, DEFAULT_FAIL_LIMIT)
+        return get_rank_table().fail_limit[self.rank_index]
 
     @property
     def can_try_promotion(self) -> bool:
-        return (self.rank != "CEO") and (self.exp >= self.required_exp)
+        t = get_rank_table()
+        return (self.rank_index < t.ceo_index) and (self.exp >= t.required_exp[self.rank_index])
 
 
 def clamp_stats(g: GameState) -> None:
@@ -81,9 +268,18 @@ def clamp_stats(g: GameState) -> None:
     g.exp = max(0, g.exp)
 
 
-def init_game_state() -> GameState:
-    """새 게임 시작용 상태 생성"""
-    g = GameState()
+def begin_action(g: GameState, code: int, arg: int = 0) -> None:
+    """행동 1회 시작: 저널에 기록하고 이 행동의 RNG로 재시드"""
+    entry = encode_action(code, arg)
+    rng = g.rng = _action_rng()
+    rng.seed(action_seed(g.seed, g.action_count))
+    g.journal += entry
+    g.action_count += 1
+
+
+def init_game_state(seed: Optional[int] = None) -> GameState:
+    """새 게임 시작용 상태 생성 (seed 없으면 무작위)"""
+    g = GameState(seed=secrets.randbits(31) if seed is None else seed)
     push_log(g, "에미드넷에 인턴으로 입사했다. 과연 CEO가 될 수 있을까?")
     push_log(g, "H대 통계학 석사 출신 박효진. 두붕과 함께 오늘도 출근.")
     return g
@@ -117,11 +313,21 @@ def reset_for_rehire(
         promotion_rate=10 + bonus_promotion,
         promotion_fail_count=0,
         retire_count=retire_count,
+        turn=prev.turn,
         title=prev.title,
         hometown=prev.hometown,
         dog_name=prev.dog_name,
         favorite=prev.favorite,
+        game_log=prev.game_log.new_career(),
         achievements=prev.achievements.copy(),
+        purchased_upgrades=set(prev.purchased_upgrades),
+        upgrade_bonuses=dict(prev.upgrade_bonuses),
+        work_reward_cache=prev.work_reward_cache,
+        triggered_ending_id=prev.triggered_ending_id,
+        seed=prev.seed,
+        action_count=prev.action_count,
+        journal=prev.journal,
+        rng=prev.rng,
     )
 
     # 퇴사사유 수집
@@ -132,9 +338,8 @@ def reset_for_rehire(
     return g
 
 
-def push_log(g: GameState, msg: str, max_logs: int = 12) -> None:
-    g.game_log.insert(0, msg)
-    g.game_log = g.game_log[:max_logs]
+def push_log(g: GameState, msg: str) -> None:
+    g.game_log.push(msg)
 
 
 def apply_effects(g: GameState, effects: Dict[str, int]) -> None:
@@ -0,0 +1,206 @@
+# ceoparkmake/game/upgrades.py
+
+"""
+업그레이드 카탈로그 (콘텐츠 로드 시 1회 빌드)
+
+- 아이템별 효과 문구 / 상점 설명을 미리 만들어 둔다 (rerun마다 if/elif 없음)
+- 선행 조건: 아이템의 "requires" 필드, 없으면 id가 <이름>_<N> 일 때 <이름>_<N-1> (Lv.1 -> Lv.2)
+
+구매 / 효과 적용도 여기서: 업무 보너스가 바뀌면 직급별 실제 업무 보상 테이블
+(기본 보상 + 보너스)을 다시 만들어 GameState에 캐시 -> do_work는 조회 1번 + clamp 1번.
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .ranks import RankTable, WorkReward, get_rank_table
+from .state import GameState, clamp_stats, push_log
+
+
+# 효과 키 -> 표시 문구
+EFFECT_LABELS = {
+    "work_money_bonus": "업무 돈 +{}",
+    "work_exp_bonus": "업무 경력 +{}",
+    "promotion_rate": "승진확률 +{}%",
+    "hp_max": "최대체력 +{}",
+    "mental_max": "최대멘탈 +{}",
+    "hp": "체력 +{}",
+    "mental": "멘탈 +{}",
+}
+
+_LEVEL_ID = re.compile(r"^(.+)_(\d+)$")
+
+
+def effect_text(effects: Dict[str, Any]) -> str:
+    parts = []
+    for k, v in effects.items():
+        label = EFFECT_LABELS.get(k)
+        parts.append(label.format(v) if label else f"{k}:{v}")
+    return ", ".join(parts)
+
+
+@dataclass(frozen=True, slots=True)
+class UpgradeRow:
+    index: int  # upgrade_list() 순서 = 행동 저널의 업그레이드 번호
+    id: str
+    name: str
+    category: str
+    cost: int
+    effect_text: str
+    caption: str  # 상점 설명 줄
+    requires: Optional[str] = None  # 선행 업그레이드 id
+    item: Dict[str, Any] = field(default_factory=dict, compare=False)  # upgrades.json 원본
+
+    def unlocked(self, purchased: Iterable[str]) -> bool:
+        return self.requires is None or self.requires in purchased
+
+
+class UpgradeCatalog:
+    """
+    upgrades.json 컴파일 결과
+    - rows: 카테고리 순서로 펼친 전체 (저널 번호 기준이라 순서 고정)
+    - id가 없거나 겹치는 아이템은 errors에 기록 (번호가 밀리지 않게 목록에는 남김)
+    """
+
+    __slots__ = ("rows", "categories", "errors", "_by_id")
+
+    def __init__(self, upgrades: Dict[str, Tuple[Dict[str, Any], ...]]):
+        flat = [(cat, item) for cat, items in upgrades.items() for item in items]
+        names: Dict[str, str] = {}
+        for _, item in flat:
+            names.setdefault(str(item.get("id", "")), str(item.get("name", "업그레이드")))
+        errors = []
+
+        rows: List[UpgradeRow] = []
+        by_id: Dict[str, UpgradeRow] = {}
+        for i, (cat, item) in enumerate(flat):
+            uid = str(item.get("id", ""))
+            try:
+                cost = int(item.get("cost", 0))
+            except (TypeError, ValueError):
+                errors.append(f"{uid or i}: invalid cost")
+                cost = 0
+            text = effect_text(item.get("effects") or {})
+            caption = f"비용 {cost}원 · {text}" if text else f"비용 {cost}원"
+
+            requires = item.get("requires")
+            if requires is not None:
+                requires = str(requires)
+                if requires not in names:
+                    errors.append(f"{uid or i}: unknown requires {requires}")
+            else:
+                m = _LEVEL_ID.match(uid)
+                if m and int(m.group(2)) > 1:
+                    prev = f"{m.group(1)}_{int(m.group(2)) - 1}"
+                    if prev in names:
+                        requires = prev
+            if requires is not None:
+                caption += f" · 선행: {names.get(requires, requires)}"
+
+            row = UpgradeRow(i, uid, str(item.get("name", "업그레이드")), cat, cost, text, caption, requires, item)
+            rows.append(row)
+            if not uid:
+                errors.append(f"{cat}[{i}]: missing upgrade id")
+            elif uid in by_id:
+                errors.append(f"{uid}: duplicate upgrade id")
+            else:
+                by_id[uid] = row
+
+        self.rows = tuple(rows)
+        self.categories: Dict[str, Tuple[UpgradeRow, ...]] = {
+            cat: tuple(r for r in self.rows if r.category == cat) for cat in upgrades
+        }
+        self.errors = tuple(errors)
+        self._by_id = by_id
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def at(self, index: int) -> Optional[UpgradeRow]:
+        return self.rows[index] if 0 <= index < len(self.rows) else None
+
+    def get(self, upgrade_id: str) -> Optional[UpgradeRow]:
+        return self._by_id.get(upgrade_id)
+
+
+# -------------------------
+# 업무 보상 (기본 + 업그레이드 보너스)
+# -------------------------
+WORK_BONUS_KEYS = ("work_money_bonus", "work_exp_bonus")
+
+
+@lru_cache(maxsize=64)
+def effective_work_rewards(table: RankTable, money_bonus: int, exp_bonus: int) -> Tuple[WorkReward, ...]:
+    """직급별 업무 보상에 영구 보너스를 더한 테이블 (음수 보너스는 무시)"""
+    money_bonus = max(0, money_bonus)
+    exp_bonus = max(0, exp_bonus)
+    return tuple(w._replace(money=w.money + money_bonus, exp=w.exp + exp_bonus) for w in table.work_reward)
+
+
+def refresh_work_rewards(g: GameState) -> Tuple[WorkReward, ...]:
+    table = get_rank_table()
+    bonuses = g.upgrade_bonuses
+    rewards = effective_work_rewards(
+        table,
+        int(bonuses.get("work_money_bonus", 0)),
+        int(bonuses.get("work_exp_bonus", 0)),
+    )
+    g.work_reward_cache = (table, rewards)
+    return rewards
+
+
+def work_reward(g: GameState) -> WorkReward:
+    """현재 직급 업무 보상 (직급 테이블이 교체됐으면 다시 계산)"""
+    cache = g.work_reward_cache
+    if cache is None or cache[0] is not get_rank_table():
+        return refresh_work_rewards(g)[g.rank_index]
+    return cache[1][g.rank_index]
+
+
+# -------------------------
+# 효과 적용 / 구매
+# -------------------------
+def apply_upgrade_effects(g: GameState, effects: Dict[str, Any]) -> None:
+    """
+    upgrades.json 효과 적용
+    - 즉시효과: hp, mental, hp_max, mental_max, promotion_rate
+    - 영구보너스: work_money_bonus, work_exp_bonus (GameState.upgrade_bonuses에 누적 -> 보상 테이블 갱신)
+    """
+    if not effects:
+        return
+
+    # 즉시/스탯 효과
+    if "hp_max" in effects:
+        g.hp_max += int(effects["hp_max"])
+    if "mental_max" in effects:
+        g.mental_max += int(effects["mental_max"])
+    if "hp" in effects:
+        g.hp += int(effects["hp"])
+    if "mental" in effects:
+        g.mental += int(effects["mental"])
+    if "promotion_rate" in effects:
+        g.promotion_rate += int(effects["promotion_rate"])
+
+    # 영구 업무 보너스
+    if any(key in effects for key in WORK_BONUS_KEYS):
+        for key in WORK_BONUS_KEYS:
+            g.upgrade_bonuses[key] = g.upgrade_bonuses.get(key, 0) + int(effects.get(key, 0))
+        refresh_work_rewards(g)
+
+    clamp_stats(g)
+
+
+def purchase_upgrade(g: GameState, item: Dict[str, Any]) -> bool:
+    """업그레이드 구매 (이미 샀거나 돈이 부족하면 False)"""
+    uid = item.get("id", "")
+    cost = int(item.get("cost", 0))
+    if uid in g.purchased_upgrades or g.money < cost:
+        return False
+
+    g.money -= cost
+    apply_upgrade_effects(g, item.get("effects", {}))
+    g.purchased_upgrades.add(uid)
+    push_log(g, f"🛍️ 업그레이드 구매: {item.get('name', '업그레이드')}")
+    return True
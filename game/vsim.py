@@ -0,0 +1,288 @@
+# ceoparkmake/game/vsim.py
+
+"""
+NumPy 벡터화 커리어 시뮬레이터 (밸런스 테이블 스윕용)
+
+커리어 N개의 스탯을 배열로 들고 한 스텝에 전원이 행동 1회씩 진행한다.
+game.logic의 업무/휴식/알바/승진/번아웃/재입사 규칙을 그대로 옮겼고,
+대화/모험 이벤트는 모델링하지 않는다 (이벤트까지 보려면 game.sim).
+
+예:
+  python -m game.vsim -n 1000000 --policy rest
+"""
+
+import argparse
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from .conditions import CompiledCondition
+from .content import get_content
+from .logic import EndingTable
+from .ranks import RankTable, get_rank_table
+from .sim import SimSummary
+
+
+# 행동 코드
+ACT_WORK, ACT_REST, ACT_PART_TIME, ACT_PROMOTE = 0, 1, 2, 3
+
+
+# -------------------------
+# 직급 인덱스 룩업 테이블
+# -------------------------
+@dataclass(frozen=True)
+class RankArrays:
+    work_money: np.ndarray
+    work_exp: np.ndarray
+    work_hp_cost: np.ndarray
+    work_mental_cost: np.ndarray
+    base_rate: np.ndarray
+    required_exp: np.ndarray
+    fail_limit: np.ndarray
+
+    @property
+    def ceo_index(self) -> int:
+        return len(self.required_exp) - 1
+
+
+def build_rank_arrays(table: Optional[RankTable] = None) -> RankArrays:
+    """RankTable(기본: 현재 테이블, 스윕 시 수정본) -> rank_index 배열"""
+    t = table or get_rank_table()
+
+    def _arr(values):
+        return np.array(values, dtype=np.int64)
+
+    return RankArrays(
+        work_money=_arr([r.money for r in t.work_reward]),
+        work_exp=_arr([r.exp for r in t.work_reward]),
+        work_hp_cost=_arr([r.hp_cost for r in t.work_reward]),
+        work_mental_cost=_arr([r.mental_cost for r in t.work_reward]),
+        base_rate=_arr(t.base_promotion_rate),
+        required_exp=_arr(t.required_exp),
+        fail_limit=_arr(t.fail_limit),
+    )
+
+
+# -------------------------
+# 엔딩 조건 -> 배열 마스크
+# -------------------------
+def _ending_mask(c: "VecCareers", cond: CompiledCondition) -> np.ndarray:
+    """game.conditions 컴파일 결과를 배열에 그대로 적용 (operator 함수는 배열에도 동작)"""
+    if not cond.rank_limited:
+        mask = np.ones(c.n, dtype=bool)
+    else:
+        mask = np.isin(c.rank_index, sorted(cond.ranks))
+    for field_name, op, threshold in cond.checks:
+        mask &= op(getattr(c, field_name), threshold)
+    return mask
+
+
+# -------------------------
+# 커리어 배열
+# -------------------------
+class VecCareers:
+    """커리어 n개의 struct-of-arrays 상태"""
+
+    def __init__(
+        self,
+        n: int,
+        seed: int = 0,
+        tables: Optional[RankArrays] = None,
+        endings: Optional[EndingTable] = None,
+    ):
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+        self.t = tables or build_rank_arrays()
+        self.endings = get_content().endings if endings is None else endings
+
+        i64 = np.int64
+        self.rank_index = np.zeros(n, dtype=i64)
+        self.hp = np.full(n, 100, dtype=i64)
+        self.hp_max = np.full(n, 100, dtype=i64)
+        self.mental = np.full(n, 100, dtype=i64)
+        self.mental_max = np.full(n, 100, dtype=i64)
+        self.exp = np.zeros(n, dtype=i64)
+        self.money = np.full(n, 500, dtype=i64)
+        self.promotion_rate = np.full(n, 10, dtype=i64)
+        self.fail_count = np.zeros(n, dtype=i64)
+        self.retire_count = np.zeros(n, dtype=i64)
+        self.company_count = np.ones(n, dtype=i64)
+
+        self.steps = 0
+        self.active = np.ones(n, dtype=bool)  # CEO 도달 전
+        self.turns_to_ceo = np.full(n, -1, dtype=i64)
+        self.ending = np.full(n, -1, dtype=i64)  # endings 목록 인덱스 (최초 1회)
+
+    # 엔딩 조건용 GameState 필드 이름 맞춤
+    @property
+    def promotion_fail_count(self) -> np.ndarray:
+        return self.fail_count
+
+    @property
+    def turn(self) -> int:
+        return self.steps
+
+    # --- 정책 ---
+    def choose(self, policy: str, hp_min: int = 30, mental_min: int = 30) -> np.ndarray:
+        can_promote = (self.rank_index != self.t.ceo_index) & (self.exp >= self.t.required_exp[self.rank_index])
+
+        if policy == "random":
+            act = self.rng.integers(0, 3, self.n)
+            promote_roll = self.rng.integers(0, 4, self.n) == 0
+            return np.where(can_promote & promote_roll, ACT_PROMOTE, act)
+
+        act = np.where(can_promote, ACT_PROMOTE, ACT_WORK)
+        if policy == "rest":
+            tired = (self.hp < hp_min) | (self.mental < mental_min)
+            act = np.where(tired, ACT_REST, act)
+        elif policy != "greedy":
+            raise ValueError(f"unknown policy: {policy}")
+        return act
+
+    # --- 한 스텝 ---
+    def step(self, act: np.ndarray) -> None:
+        """
+        전원 행동 1회
+        행동별 인덱스 배열로 나눠서 필요한 만큼만 난수를 뽑는다.
+        """
+        t, rng = self.t, self.rng
+        act = np.where(self.active, act, -1)
+        retire = np.zeros(self.n, dtype=bool)
+
+        # 업무
+        w = np.flatnonzero(act == ACT_WORK)
+        if w.size:
+            ri = self.rank_index[w]
+            self.money[w] += t.work_money[ri]
+            self.exp[w] += t.work_exp[ri]
+            self.hp[w] -= t.work_hp_cost[ri]
+            self.mental[w] -= t.work_mental_cost[ri]
+            lucky = w[rng.random(w.size) < 0.15]
+            self.money[lucky] += rng.integers(10, 41, lucky.size)
+
+        # 휴식
+        w = np.flatnonzero(act == ACT_REST)
+        if w.size:
+            self.hp[w] += rng.integers(10, 19, w.size)
+            self.mental[w] += rng.integers(8, 15, w.size)
+
+        # 알바 (5% 퇴사)
+        w = np.flatnonzero(act == ACT_PART_TIME)
+        if w.size:
+            self.money[w] += rng.integers(300, 601, w.size)
+            self.exp[w] += rng.integers(5, 21, w.size)
+            self.hp[w] -= 3
+            self.mental[w] -= 2
+            retire[w[rng.random(w.size) < 0.05]] = True
+
+        # 승진 심사
+        w = np.flatnonzero(act == ACT_PROMOTE)
+        if w.size:
+            ri = self.rank_index[w]
+            rate = np.clip(t.base_rate[ri] + self.promotion_rate[w], 1, 100)
+            ok = rng.integers(1, 101, w.size) <= rate
+            self.exp[w] = 0
+
+            s = w[ok]
+            self.rank_index[s] = np.minimum(ri[ok] + 1, self.t.ceo_index)
+            self.fail_count[s] = 0
+            self.promotion_rate[s] = np.maximum(0, self.promotion_rate[s] - 3)
+            self.hp[s] -= 6
+            self.mental[s] += 5
+
+            f = w[~ok]
+            self.fail_count[f] += 1
+            self.hp[f] -= 8
+            self.mental[f] -= 10
+            retire[f[self.fail_count[f] >= t.fail_limit[ri[~ok]]]] = True
+
+        self._clamp()
+
+        # 번아웃 (check_for_forced_retirement)
+        retire |= self.active & ((self.hp <= 0) | (self.mental <= 0))
+        self._rehire(retire)
+
+        self.steps += 1
+        self._check_endings()
+
+        reached = self.active & (self.rank_index == self.t.ceo_index)
+        self.turns_to_ceo[reached] = self.steps
+        self.active &= ~reached
+
+    def _clamp(self) -> None:
+        np.clip(self.hp, 0, self.hp_max, out=self.hp)
+        np.clip(self.mental, 0, self.mental_max, out=self.mental)
+        np.clip(self.promotion_rate, 0, 100, out=self.promotion_rate)
+        np.maximum(self.money, 0, out=self.money)
+        np.maximum(self.exp, 0, out=self.exp)
+
+    def _rehire(self, m: np.ndarray) -> None:
+        """reset_for_rehire 규칙을 마스크로 적용"""
+        if not m.any():
+            return
+        self.retire_count += m
+        self.company_count += m
+        self.rank_index[m] = 0
+        self.hp[m] = 100
+        self.hp_max[m] = 100
+        self.mental[m] = 100
+        self.mental_max[m] = 100
+        self.exp[m] = 0
+        self.money[m] = 500 + self.retire_count[m] * 100
+        self.promotion_rate[m] = 10 + np.minimum(15, self.retire_count[m])
+        self.fail_count[m] = 0
+
+    def _check_endings(self) -> None:
+        pending = self.ending < 0
+        if not pending.any():
+            return
+        for i, cond in enumerate(self.endings.conditions):
+            hit = pending & _ending_mask(self, cond)
+            self.ending[hit] = i
+            pending &= ~hit
+
+    # --- 실행 / 집계 ---
+    def run(self, policy: str = "greedy", max_steps: int = 5000) -> "VecCareers":
+        while self.steps < max_steps and self.active.any():
+            self.step(self.choose(policy))
+        return self
+
+    def summary(self) -> SimSummary:
+        """game.sim과 같은 SimSummary로 집계"""
+        s = SimSummary(careers=self.n)
+        reached = self.turns_to_ceo >= 0
+        s.ceo_count = int(reached.sum())
+        s.turns_to_ceo = Counter(dict(zip(*(a.tolist() for a in np.unique(self.turns_to_ceo[reached], return_counts=True)))))
+        s.retire_counts = Counter(dict(zip(*(a.tolist() for a in np.unique(self.retire_count, return_counts=True)))))
+
+        ids = [e.get("id") for e in self.endings.endings] + ["none"]
+        codes, counts = np.unique(self.ending, return_counts=True)
+        s.endings = Counter({ids[c]: int(k) for c, k in zip(codes.tolist(), counts.tolist())})
+        return s
+
+
+def run_vectorized(
+    n: int,
+    policy: str = "greedy",
+    seed: int = 0,
+    max_steps: int = 5000,
+    tables: Optional[RankArrays] = None,
+) -> SimSummary:
+    return VecCareers(n, seed=seed, tables=tables).run(policy, max_steps).summary()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="ceoparkmake 벡터화 시뮬레이션")
+    parser.add_argument("-n", "--careers", type=int, default=100000)
+    parser.add_argument("--policy", choices=["greedy", "rest", "random"], default="greedy")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-steps", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    print(run_vectorized(args.careers, args.policy, args.seed, args.max_steps).report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# ceoparkmake/tests/__init__.py
@@ -0,0 +1,23 @@
+# ceoparkmake/tests/test_conditions.py
+
+import dataclasses
+
+import pytest
+
+from game.conditions import ConditionError, compile_conditions
+from game.ranks import get_rank_table, pinned_rank_table
+
+
+def test_rank_names_follow_current_table():
+    base = get_rank_table()
+    renamed = dataclasses.replace(base, names=("수습",) + base.names[1:])
+    with pinned_rank_table(renamed):
+        assert compile_conditions({"rank_is": "수습"}).ranks == frozenset({0})
+        with pytest.raises(ConditionError):
+            compile_conditions({"rank_is": base.names[0]})
+
+
+def test_rank_limited_only_when_ranks_narrowed():
+    assert not compile_conditions(None).rank_limited
+    assert not compile_conditions({"min_rank": get_rank_table().names[0]}).rank_limited
+    assert compile_conditions({"max_rank": get_rank_table().names[1]}).fields == {"rank_index"}
@@ -0,0 +1,56 @@
+# ceoparkmake/tests/test_logic.py
+
+import random
+
+from game.logic import EventIndex, _pick_event_with_rules
+from game.state import init_game_state
+
+
+def _event(eid: str, weight: float, cooldown: int) -> dict:
+    return {
+        "id": eid,
+        "title": eid,
+        "text": eid,
+        "weight": weight,
+        "cooldown": cooldown,
+        "choices": [{"label": "ok", "effects": {}}],
+    }
+
+
+def test_cooling_event_never_chosen_while_fresh_one_exists():
+    # 가중치가 한쪽에 몰려 있어 다시 뽑기가 자주 실패하는 구성
+    index = EventIndex([_event("heavy", 1000, 10)] + [_event(f"e{i}", 1, 10) for i in range(4)])
+    g = init_game_state(0)
+    g.rng = random.Random(0)
+    for _ in range(5000):
+        g.turn += 1
+        fresh = {e["id"] for e in index.events if g.event_cooldowns.get(e["id"], 0) <= g.turn}
+        picked = _pick_event_with_rules(g, index)
+        if fresh:
+            assert picked["id"] in fresh
+
+
+def test_all_cooling_relaxes_cooldown():
+    index = EventIndex([_event("a", 1, 100), _event("b", 1, 100)])
+    g = init_game_state(0)
+    g.rng = random.Random(0)
+    picked = [_pick_event_with_rules(g, index)["id"] for _ in range(3)]
+    assert set(picked[:2]) == {"a", "b"}
+    assert picked[2] in ("a", "b")
+
+
+def test_unknown_rank_bound_is_an_error():
+    index = EventIndex([dict(_event("a", 1, 0), max_rank="사장"), _event("b", 1, 0)])
+    assert [e["id"] for e in index.events] == ["b"]
+    assert any(err.startswith("a:") for err in index.errors)
+
+
+def test_dialogue_choice_schema_accepted():
+    event = _event("dlg", 1, 0)
+    event["min_rank"] = "대리"
+    event["choices"] = [{"text": "네", "effects": {"exp": 5}, "result_text": "했다"}]
+    index = EventIndex([event])
+    assert not index.errors
+    choice = index.events[0]["choices"][0]
+    assert (choice["label"], choice["result"]) == ("네", "했다")
+    assert index.eligible_positions(init_game_state(0)) == []
@@ -0,0 +1,74 @@
+# ceoparkmake/tests/test_serialize.py
+
+import random
+
+import pytest
+
+from game.content import get_content
+from game.engine import WORK, REST, step
+from game.serialize import SnapshotError, dumps_state, loads_state
+from game.state import init_game_state
+from game.upgrades import work_reward
+
+
+def _played_state(seed: int, turns: int = 200):
+    content = get_content()
+    g = init_game_state(seed)
+    g.name = "김테스트"
+    for i in range(turns):
+        if g.pending_event is not None:
+            g.pending_event = None
+        g, _ = step(g, WORK if i % 3 else REST, content)
+    return g
+
+
+def test_roundtrip():
+    content = get_content()
+    g = _played_state(1)
+    restored = loads_state(dumps_state(g), content)
+    assert dumps_state(restored) == dumps_state(g)
+    assert restored.rank == g.rank
+
+
+def test_invalid_utf8_is_snapshot_error():
+    content = get_content()
+    data = bytearray(dumps_state(_played_state(2, 10)))
+    pos = data.index("김테스트".encode("utf-8"))
+    data[pos] = 0xFF
+    with pytest.raises(SnapshotError):
+        loads_state(bytes(data), content)
+
+
+@pytest.mark.parametrize("version", [1, 2, 4])
+def test_other_versions_rejected(version):
+    content = get_content()
+    data = bytearray(dumps_state(init_game_state(4)))
+    data[0] = version
+    with pytest.raises(SnapshotError):
+        loads_state(bytes(data), content)
+
+
+def test_rank_index_out_of_range():
+    content = get_content()
+    g = init_game_state(3)
+    g.rank_index = len(content.rank_table)
+    with pytest.raises(SnapshotError):
+        loads_state(dumps_state(g), content)
+
+
+def test_corrupted_bytes_fail_cleanly():
+    """깨진 스냅샷은 SnapshotError로 거부되거나, 복원된 상태가 그대로 쓸 수 있어야 한다"""
+    content = get_content()
+    rng = random.Random(0)
+    snapshots = [dumps_state(_played_state(seed)) for seed in range(5)]
+    for _ in range(3000):
+        data = bytearray(rng.choice(snapshots))
+        for _ in range(rng.randint(1, 3)):
+            data[rng.randrange(len(data))] = rng.randrange(256)
+        try:
+            g = loads_state(bytes(data), content)
+        except SnapshotError:
+            continue
+        assert g.rank and g.fail_limit >= 0
+        work_reward(g)
+        step(g, WORK, content)
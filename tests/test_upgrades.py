@@ -0,0 +1,45 @@
+# ceoparkmake/tests/test_upgrades.py
+
+import dataclasses
+
+from game.content import get_content
+from game.engine import step, upgrade
+from game.state import init_game_state
+from game.upgrades import UpgradeCatalog
+
+
+def _catalog() -> UpgradeCatalog:
+    return UpgradeCatalog({
+        "업무": (
+            {"id": "speech_1", "name": "발표 Lv.1", "cost": 10},
+            {"id": "speech_2", "name": "발표 Lv.2", "cost": 10},
+            {"id": "coffee", "name": "커피", "cost": 10, "requires": "speech_2"},
+            {"id": "solo_2", "name": "Lv.1 없음", "cost": 10},
+        ),
+    })
+
+
+def test_inferred_prerequisite():
+    catalog = _catalog()
+    assert catalog.get("speech_1").requires is None
+    assert catalog.get("speech_2").requires == "speech_1"
+    assert "발표 Lv.1" in catalog.get("speech_2").caption
+    assert catalog.get("solo_2").requires is None  # <이름>_1이 없으면 선행 없음
+
+
+def test_explicit_requires_wins():
+    catalog = _catalog()
+    assert catalog.get("coffee").requires == "speech_2"
+    bad = UpgradeCatalog({"c": ({"id": "a", "cost": 1, "requires": "missing"},)})
+    assert bad.errors == ("a: unknown requires missing",)
+
+
+def test_locked_upgrade_not_purchased():
+    catalog = _catalog()
+    content = dataclasses.replace(get_content(), upgrade_catalog=catalog)
+    g = init_game_state(0)
+    g, out = step(g, upgrade(catalog.get("speech_2").index), content)
+    assert not out.purchased and "speech_2" not in g.purchased_upgrades
+    g, out = step(g, upgrade(catalog.get("speech_1").index), content)
+    g, out = step(g, upgrade(catalog.get("speech_2").index), content)
+    assert out.purchased and {"speech_1", "speech_2"} <= g.purchased_upgrades
@@ -0,0 +1,185 @@
+# ceoparkmake/ui/assets.py
+
+"""
+이미지 에셋 레지스트리 (프로세스당 1회 로드)
+
+- assets/images/* 를 시작 시 한 번 읽고 sha256으로 이름을 붙인다 (name.<hash>.png)
+- 정적 서빙(server.enableStaticServing)이 켜져 있으면 static/ 에 해시 이름으로 복사해
+  /app/static/... URL을 쓰고, 아니면 data URI로 대체
+  -> 파일 내용이 바뀌면 URL도 바뀌므로 브라우저/프록시가 이름 기준으로 오래 캐시해도 안전
+- 캐릭터 그림은 스프라이트 시트 한 장으로 묶어서 직급이 바뀌어도 새 이미지를 받지 않게 (PIL 있을 때만)
+
+rerun마다 파일 I/O나 st.image 미디어 등록 없이 HTML <img> / 배경 이미지로 그린다.
+"""
+
+import base64
+import hashlib
+import io
+import mimetypes
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from streamlit import config
+
+
+APP_DIR = Path(__file__).resolve().parent.parent
+ASSET_DIR = APP_DIR / "assets"
+IMG_DIR = ASSET_DIR / "images"
+
+# Streamlit 정적 서빙: <앱 폴더>/static/* -> /app/static/*
+STATIC_DIR = APP_DIR / "static"
+STATIC_URL = "app/static"
+
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".webp")
+
+# 직급별 캐릭터 그림 (스프라이트 시트 프레임 순서)
+CHARACTER_FRAMES = ("hyojin_intern.png", "hyojin_manager.png")
+SPRITE_SHEET_NAME = "characters.png"
+
+
+def static_serving_enabled() -> bool:
+    try:
+        return bool(config.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
+def content_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def publish_static(name: str, data: bytes) -> Optional[str]:
+    """
+    static/<stem>.<hash><suffix> 로 저장하고 URL 반환 (쓸 수 없으면 None)
+    같은 이름의 예전 해시 파일은 정리
+    """
+    stem, suffix = os.path.splitext(name)
+    hashed = f"{stem}.{content_digest(data)}{suffix}"
+    path = STATIC_DIR / hashed
+    try:
+        STATIC_DIR.mkdir(exist_ok=True)
+        if not path.exists():
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        for old in STATIC_DIR.glob(f"{stem}.*{suffix}"):
+            if old.name != hashed and len(old.name) == len(hashed):
+                old.unlink()
+    except OSError:
+        return None
+    return f"{STATIC_URL}/{hashed}"
+
+
+@dataclass(frozen=True)
+class Asset:
+    name: str
+    mimetype: str
+    digest: str
+    size: Tuple[int, int]  # (가로, 세로) - 모르면 (0, 0)
+    url: str  # 정적 URL 또는 data URI
+
+
+@dataclass(frozen=True)
+class SpriteSheet:
+    asset: Asset
+    frames: Dict[str, Tuple[int, int, int, int]]  # 원본 이름 -> (x, y, 가로, 세로)
+
+
+def _make_asset(name: str, data: bytes, size: Tuple[int, int], static: bool) -> Asset:
+    mimetype = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    url = publish_static(name, data) if static else None
+    if url is None:
+        url = f"data:{mimetype};base64,{base64.b64encode(data).decode('ascii')}"
+    return Asset(name=name, mimetype=mimetype, digest=content_digest(data), size=size, url=url)
+
+
+def _image_size(data: bytes) -> Tuple[int, int]:
+    try:
+        from PIL import Image
+    except ImportError:
+        return (0, 0)
+    try:
+        with Image.open(io.BytesIO(data)) as im:
+            return im.size
+    except Exception:
+        return (0, 0)
+
+
+def _build_sprite_sheet(sources: Dict[str, bytes], static: bool) -> Optional[SpriteSheet]:
+    """CHARACTER_FRAMES를 가로로 이어 붙인 PNG 한 장 (PIL 없거나 프레임이 빠지면 None)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    if not all(name in sources for name in CHARACTER_FRAMES):
+        return None
+
+    images = [Image.open(io.BytesIO(sources[name])).convert("RGBA") for name in CHARACTER_FRAMES]
+    sheet = Image.new("RGBA", (sum(im.width for im in images), max(im.height for im in images)))
+    frames = {}
+    x = 0
+    for name, im in zip(CHARACTER_FRAMES, images):
+        sheet.paste(im, (x, 0))
+        frames[name] = (x, 0, im.width, im.height)
+        x += im.width
+
+    buf = io.BytesIO()
+    sheet.save(buf, format="PNG", optimize=True)
+    return SpriteSheet(_make_asset(SPRITE_SHEET_NAME, buf.getvalue(), sheet.size, static), frames)
+
+
+class AssetRegistry:
+    def __init__(self, img_dir: Path = IMG_DIR, static: Optional[bool] = None):
+        if static is None:
+            static = static_serving_enabled()
+
+        sources: Dict[str, bytes] = {}
+        if img_dir.is_dir():
+            for path in sorted(img_dir.iterdir()):
+                if path.suffix.lower() in IMAGE_SUFFIXES:
+                    sources[path.name] = path.read_bytes()
+
+        self.assets: Dict[str, Asset] = {
+            name: _make_asset(name, data, _image_size(data), static) for name, data in sources.items()
+        }
+        self.sprites = _build_sprite_sheet(sources, static)
+
+    def get(self, name: str) -> Optional[Asset]:
+        return self.assets.get(name)
+
+    @lru_cache(maxsize=64)
+    def img_html(self, name: str, width: Optional[int] = None, alt: str = "") -> str:
+        """<img> 태그 (width 없으면 컨테이너 너비), 없는 에셋은 빈 문자열"""
+        asset = self.assets.get(name)
+        if asset is None:
+            return ""
+        style = f"width:{width}px;" if width else "width:100%;"
+        return f'<img src="{asset.url}" alt="{alt}" style="{style}height:auto;image-rendering:pixelated;display:block;" />'
+
+    @lru_cache(maxsize=64)
+    def sprite_html(self, name: str, width: int, alt: str = "") -> str:
+        """스프라이트 시트 프레임 (시트가 없으면 개별 이미지)"""
+        sheet = self.sprites
+        if sheet is None or name not in sheet.frames:
+            return self.img_html(name, width, alt)
+
+        x, y, w, h = sheet.frames[name]
+        scale = width / w
+        sheet_w, sheet_h = sheet.asset.size
+        return (
+            f'<div role="img" aria-label="{alt}" style="'
+            f"width:{width}px;height:{round(h * scale)}px;"
+            f"background-image:url('{sheet.asset.url}');background-repeat:no-repeat;"
+            f"background-size:{round(sheet_w * scale)}px {round(sheet_h * scale)}px;"
+            f"background-position:-{round(x * scale)}px -{round(y * scale)}px;"
+            f'image-rendering:pixelated;"></div>'
+        )
+
+
+@lru_cache(maxsize=1)
+def get_assets() -> AssetRegistry:
+    """프로세스 전역 레지스트리 (첫 호출 때 1회 로드)"""
+    return AssetRegistry()
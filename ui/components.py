@@ -1,13 +1,56 @@
 # ceoparkmake/ui/components.py
 
+from functools import lru_cache
 from pathlib import Path
+
 import streamlit as st
+import streamlit.components.v1 as components
 
 from game.logic import get_total_promotion_rate
+from game.odds import promotion_odds
+
+from .assets import get_assets
+
+
+# -------------------------
+# 렌더 캐시
+# -------------------------
+# 패널 HTML은 실제로 쓰는 필드 값만 키로 메모 (같은 값이면 f-string 재조립 없음)
+RENDER_CACHE_SIZE = 256
+
+# 위젯이 있는 패널은 fragment로 감싸서 그 패널 입력만 바뀌면 패널만 rerun
+# (fragment 없는 구버전 Streamlit에서는 그냥 함수 그대로)
+fragment = getattr(st, "fragment", None) or (lambda func: func)
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _profile_html(company_count, company_name, rank, hometown, title, dog_name, favorite) -> str:
+    return f"""
+            <div style="font-size:26px;font-weight:800;">박효진은 CEO가 될 수 있을까?</div>
+            <div style="font-size:14px;color:#555;">
+                {company_count}번째 회사 · {company_name} · 현재 직급: <b>{rank}</b>
+            </div>
+            <div style="font-size:13px;color:#666;margin-top:4px;">
+                {hometown} 출신 · {title} · 반려견 {dog_name} · 취미 {favorite}
+            </div>
+            """
+
 
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _badges_html(money, exp, required_exp, rate, retire_count, odds) -> str:
+    badges = [
+        f"💰 {money}원",
+        f"📚 {exp}/{required_exp}",
+        f"📈 승진확률 {rate}%",
+        f"💥 퇴사 {retire_count}회",
+    ]
 
-ASSET_DIR = Path(__file__).resolve().parent.parent / "assets"
-IMG_DIR = ASSET_DIR / "images"
+    # 승진 전망 (DP, 이벤트 제외 모델)
+    if odds.next_rank is not None:
+        badges.append(f"🎯 다음 직급 {odds.next_rank:.0%} · 권고사직 {odds.resign:.0%}")
+        badges.append(f"👑 CEO까지 업무 약 {odds.expected_work_turns_to_ceo:,.0f}회")
+
+    return "".join([f'<span class="pixel-badge">{b}</span>' for b in badges])
 
 
 def render_header(g):
@@ -16,32 +59,17 @@ def render_header(g):
     c1, c2 = st.columns([1.2, 2.8], vertical_alignment="top")
 
     with c1:
-        bg_path = IMG_DIR / "bg_office.png"
-        if bg_path.exists():
-            st.image(str(bg_path), use_container_width=True)
+        bg = get_assets().img_html("bg_office.png", alt="사무실")
+        if bg:
+            st.markdown(bg, unsafe_allow_html=True)
 
     with c2:
         st.markdown(
-            f"""
-            <div style="font-size:26px;font-weight:800;">박효진은 CEO가 될 수 있을까?</div>
-            <div style="font-size:14px;color:#555;">
-                {g.company_count}번째 회사 · {g.company_name} · 현재 직급: <b>{g.rank}</b>
-            </div>
-            <div style="font-size:13px;color:#666;margin-top:4px;">
-                {g.hometown} 출신 · {g.title} · 반려견 {g.dog_name} · 취미 {g.favorite}
-            </div>
-            """,
+            _profile_html(g.company_count, g.company_name, g.rank, g.hometown, g.title, g.dog_name, g.favorite),
             unsafe_allow_html=True
         )
-
-        badges = [
-            f"💰 {g.money}원",
-            f"📚 {g.exp}/{g.required_exp}",
-            f"📈 승진확률 {get_total_promotion_rate(g)}%",
-            f"💥 퇴사 {g.retire_count}회",
-        ]
         st.markdown(
-            "".join([f'<span class="pixel-badge">{b}</span>' for b in badges]),
+            _badges_html(g.money, g.exp, g.required_exp, get_total_promotion_rate(g), g.retire_count, promotion_odds(g)),
             unsafe_allow_html=True
         )
 
@@ -61,11 +89,18 @@ def _bar_html(label: str, value: int, max_value: int, css_class: str):
     """
 
 
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _status_html(hp, hp_max, mental, mental_max, exp, required_exp) -> str:
+    return (
+        _bar_html("체력", hp, hp_max, "stat-fill-hp")
+        + _bar_html("멘탈", mental, mental_max, "stat-fill-mental")
+        + _bar_html("경력", exp, required_exp, "stat-fill-exp")
+    )
+
+
 def render_status_panel(g):
     st.markdown(
-        _bar_html("체력", g.hp, g.hp_max, "stat-fill-hp")
-        + _bar_html("멘탈", g.mental, g.mental_max, "stat-fill-mental")
-        + _bar_html("경력", g.exp, g.required_exp, "stat-fill-exp"),
+        _status_html(g.hp, g.hp_max, g.mental, g.mental_max, g.exp, g.required_exp),
         unsafe_allow_html=True
     )
 
@@ -76,47 +111,77 @@ def render_character_panel(g):
     with c1:
         # 직급 기준으로 간단히 스프라이트 분기
         img_name = "hyojin_intern.png" if g.rank_index <= 4 else "hyojin_manager.png"
-        img_path = IMG_DIR / img_name
-        if img_path.exists():
-            st.image(str(img_path), width=180)
+        img = get_assets().sprite_html(img_name, width=180, alt="박효진")
+        if img:
+            st.markdown(img, unsafe_allow_html=True)
         else:
             st.info("캐릭터 이미지 없음")
 
     with c2:
-        dubung_path = IMG_DIR / "dubung.png"
-        if dubung_path.exists():
-            st.image(str(dubung_path), width=140)
+        dubung = get_assets().img_html("dubung.png", width=140, alt=g.dog_name)
+        if dubung:
+            st.markdown(dubung, unsafe_allow_html=True)
             st.caption(f"{g.dog_name} (효진의 멘탈 담당)")
         else:
             st.info("두붕 이미지 없음")
 
 
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _event_html(title, speaker, text) -> str:
+    return f"""
+        <div class="event-panel">
+          <div class="event-title">{title}</div>
+          <div class="event-speaker">[{speaker}]</div>
+          <div class="event-text">{text}</div>
+        </div>
+        """
+
+
 def render_event_panel(g):
     if not g.pending_event:
         return
 
     e = g.pending_event
-    title = e.get("title", "이벤트")
-    speaker = e.get("speaker", "알림")
-    text = e.get("text", "")
-
     st.markdown(
-        f"""
-        <div class="event-panel">
-          <div class="event-title">{title}</div>
-          <div class="event-speaker">[{speaker}]</div>
-          <div class="event-text">{text}</div>
-        </div>
-        """,
+        _event_html(e.get("title", "이벤트"), e.get("speaker", "알림"), e.get("text", "")),
         unsafe_allow_html=True
     )
 
 
+# -------------------------
+# 로그 (증분 컴포넌트)
+# -------------------------
+LOG_COMPONENT_DIR = Path(__file__).resolve().parent / "log_component"
+LOG_KEY = "game_log_view"
+_log_component = components.declare_component("game_log", path=str(LOG_COMPONENT_DIR))
+
+
 def render_logs(g):
+    """
+    브라우저에 이미 보낸 로그는 다시 보내지 않는다
+    - session_state.log_sent = (epoch, seq): 마지막으로 보낸 로그 번호
+    - 로그 객체가 바뀌었거나(새 게임/재입사/복원) 브라우저가 재전송을 요청하면 전체 전송
+    """
     st.markdown('<div class="section-title">📜 최근 로그</div>', unsafe_allow_html=True)
-    items = g.game_log or []
-    html = '<div class="log-box">'
-    for msg in items:
-        html += f'<div class="log-item">{msg}</div>'
-    html += "</div>"
-    st.markdown(html, unsafe_allow_html=True)
+
+    log = g.game_log
+    ss = st.session_state
+    sent = ss.get("log_sent")
+    resync = (ss.get(LOG_KEY) or {}).get("resync")
+
+    reset = sent is None or sent[0] != log.epoch or resync != ss.get("log_resync")
+    from_seq = log.seq - len(log) if reset else sent[1]
+    entries = log.since(from_seq)
+
+    ss.log_sent = (log.epoch, log.seq)
+    ss.log_resync = resync
+
+    _log_component(
+        epoch=log.epoch,
+        reset=reset,
+        from_seq=from_seq,
+        entries=entries,
+        capacity=log.capacity,
+        key=LOG_KEY,
+        default=None,
+    )
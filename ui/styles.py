@@ -1,13 +1,73 @@
 # ceoparkmake/ui/styles.py
 
+"""
+전역 CSS 적용
+
+PIXEL_CSS를 프로세스당 한 번 압축(minify) + 해시해서 static/pixel.<hash>.css 로 내보내고,
+작은 정적 컴포넌트가 부모 문서 <head>에 <link>를 한 번만 붙인다 (같은 해시가 있으면 아무것도 안 함).
+-> rerun마다 스타일시트 전체를 다시 보내지 않는다.
+정적 서빙이 꺼져 있거나 부모 문서에 접근할 수 없으면 압축된 <style>을 인라인으로 보낸다.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
 import streamlit as st
+import streamlit.components.v1 as components
+
+from .assets import content_digest, publish_static, static_serving_enabled
 from .pixel_css import PIXEL_CSS
 
 
+CSS_COMPONENT_DIR = Path(__file__).resolve().parent / "css_component"
+CSS_KEY = "pixel_css_loader"
+
+_css_component = components.declare_component("pixel_css", path=str(CSS_COMPONENT_DIR))
+
+
+def minify_css(css: str) -> str:
+    """<style> 태그 / 주석 / 불필요한 공백 제거"""
+    css = re.sub(r"</?style>", "", css)
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+@dataclass(frozen=True)
+class CssBundle:
+    text: str  # 압축된 CSS
+    digest: str
+    url: Optional[str]  # 정적 URL (정적 서빙이 꺼져 있으면 None)
+
+
+@lru_cache(maxsize=1)
+def css_bundle() -> CssBundle:
+    text = minify_css(PIXEL_CSS)
+    data = text.encode("utf-8")
+    url = publish_static("pixel.css", data) if static_serving_enabled() else None
+    return CssBundle(text=text, digest=content_digest(data), url=url)
+
+
 def apply_global_styles():
     st.set_page_config(
         page_title="박효진은 CEO가 될 수 있을까?",
         page_icon="💼",
         layout="wide"
     )
-    st.markdown(PIXEL_CSS, unsafe_allow_html=True)
+
+    ss = st.session_state
+    bundle = css_bundle()
+
+    # 컴포넌트가 부모 문서에 못 붙였다고 알려오면 이 세션은 인라인으로 전환
+    if ss.get(CSS_KEY) is False:
+        ss.css_inline = True
+
+    if bundle.url and not ss.get("css_inline", False):
+        _css_component(href=bundle.url, digest=bundle.digest, key=CSS_KEY, default=None)
+    else:
+        st.markdown(f"<style>{bundle.text}</style>", unsafe_allow_html=True)